@@ -3,19 +3,17 @@
 """ FetchHRRR submodule top-level code """
 
 import pathlib
-from datetime import datetime
-
-import pytz
+from datetime import datetime, timezone
 
 from .. import get_logger as _get_logger
 from .. import get_download_dir as _get_download_dir
 
 # Module constants
 CUR_DIR = pathlib.Path(__file__).parent.resolve()
-HRRR_V1_INIT_TIME = datetime(2014, 9, 30, 14, 0, 0).replace(tzinfo=pytz.UTC)
-HRRR_V2_INIT_TIME = datetime(2016, 8, 23, 12, 0, 0).replace(tzinfo=pytz.UTC)
-HRRR_V3_INIT_TIME = datetime(2018, 7, 12, 12, 0, 0).replace(tzinfo=pytz.UTC)
-HRRR_V4_INIT_TIME = datetime(2020, 12, 2, 12, 0, 0).replace(tzinfo=pytz.UTC)
+HRRR_V1_INIT_TIME = datetime(2014, 9, 30, 14, 0, 0, tzinfo=timezone.utc)
+HRRR_V2_INIT_TIME = datetime(2016, 8, 23, 12, 0, 0, tzinfo=timezone.utc)
+HRRR_V3_INIT_TIME = datetime(2018, 7, 12, 12, 0, 0, tzinfo=timezone.utc)
+HRRR_V4_INIT_TIME = datetime(2020, 12, 2, 12, 0, 0, tzinfo=timezone.utc)
 PRODUCT_ID_MAP = {
     'prs': '3D Pressure Levels',
     'nat': 'Native Levels',
@@ -8,13 +8,12 @@ import re
 import uuid
 import pathlib
 import urllib.parse
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, List, Optional, Tuple, Union
 import warnings
 
-import pytz
 import numpy as np
-from osgeo import gdal, osr
+from osgeo import gdal
 
 from .. import GDAL_TO_NUMPY_MAP
 from . import PRODUCT_ID_MAP, get_logger, get_download_dir
@@ -22,6 +21,16 @@ from .hrrr_inventory import HRRRInventory
 from .utils import get_hrrr_version, validate_product_id
 from ..utils import fetch_from_url, gdal_close_dataset, url_exists, is_url
 from ..utils import map_to_pix, get_extreme_points, get_px_in_ellipse
+from ..utils import get_coord_transform, srs_to_proj4
+
+# Source (HRRR Lambert Conformal Conic) and output projections, built once at import
+_HRRR_LCC_PROJ4 = srs_to_proj4(
+    '+proj=lcc +units=m +a=6370000.0 +b=6370000.0 '
+    '+lat_1=38.5 +lat_2=38.5 +lat_0=38.5 +lon_0=-97.5 +nadgrids=@null')
+_DST_PROJ4 = {
+    'world': srs_to_proj4('EPSG:4326'),
+    'map': srs_to_proj4('EPSG:3857'),
+}
 
 
 class HRRRProduct():
@@ -198,8 +207,8 @@ class HRRRProduct():
             # Determine path to download to
             download_dir = get_download_dir()
             date_dir = pathlib.Path(
-                download_dir,
-                '%s' % self.run_time.astimezone(pytz.UTC).strftime('%Y-%m-%d'))
+                download_dir, '%s' %
+                self.run_time.astimezone(timezone.utc).strftime('%Y-%m-%d'))
             date_dir.mkdir(parents=False, exist_ok=True)
             url_parse = urllib.parse.urlparse(str(self.loc))
             file_name = pathlib.PosixPath(url_parse.path).name
@@ -287,14 +296,14 @@ class HRRRProduct():
             grib_ref_timestamp = int(
                 metadata['GRIB_REF_TIME'].lstrip().split(' ')[0])
             grib_ref_time = datetime.fromtimestamp(
-                grib_ref_timestamp).astimezone(pytz.UTC)
+                grib_ref_timestamp).astimezone(timezone.utc)
         except Exception:
             raise ValueError('Could not get GRIB reference time!')
         try:
             grib_valid_timestamp = int(
                 metadata['GRIB_REF_TIME'].lstrip().split(' ')[0])
             grib_valid_time = datetime.fromtimestamp(
-                grib_valid_timestamp).astimezone(pytz.UTC)
+                grib_valid_timestamp).astimezone(timezone.utc)
         except Exception:
             raise ValueError('Could not get GRIB valid time!')
 
@@ -345,7 +354,7 @@ class HRRRProduct():
         if product_id == 'subh':
             raise NotImplementedError()
 
-        run_time = run_time.astimezone(pytz.UTC)
+        run_time = run_time.astimezone(timezone.utc)
         valid_locs = (
             ('https://storage.googleapis.com/high-resolution-rapid-refresh/'
              'hrrr.%s/conus/hrrr.t%02dz.wrf%sf%02d.grib2' %
@@ -432,34 +441,17 @@ class HRRRProduct():
         else:
             lon_min = lat_min = lon_max = lat_max = None
 
-        # Setup src coordinate system
-        # Lambert Conformal Conic Projection
-        o_srs = osr.SpatialReference()
-        o_srs.ImportFromProj4(
-            '+proj=lcc +units=m +a=6370000.0 +b=6370000.0 '
-            '+lat_1=38.5 +lat_2=38.5 +lat_0=38.5 +lon_0=-97.5 +nadgrids=@null')
-        assert len(o_srs.ExportToWkt())
-
-        # Setup destination coordinate system
-        dst_srs = osr.SpatialReference()
-        if proj == 'world':
-            dst_srs.ImportFromEPSG(4326)
-        elif proj == 'map':
-            dst_srs.ImportFromEPSG(3857)
-
-            # If map... transform bounds to meters
-            if bounds is not None:
-                wgs84_srs = osr.SpatialReference()
-                wgs84_srs.ImportFromEPSG(4326)
-                transform = osr.CoordinateTransformation(wgs84_srs, dst_srs)
-                # NOTE: WGS-84 need to be in the form of lat, lon (not lon, lat) for some reason
-                (lon_min, lat_min, _), (lon_max, lat_max, _) = [
-                    transform.TransformPoint(*e)
-                    for e in ((lat_min, lon_min), (lat_max, lon_max))
-                ]
-        else:
+        # Get destination coordinate system
+        dst_proj4 = _DST_PROJ4.get(proj)
+        if dst_proj4 is None:
             raise ValueError('Projection must be \'world\' or \'map\'!')
-        assert len(dst_srs.ExportToWkt())
+
+        # If map... transform bounds to meters
+        if proj == 'map' and bounds is not None:
+            transform = get_coord_transform('EPSG:4326', 'EPSG:3857')
+            (lon_min, lat_min, _), (lon_max, lat_max, _) = \
+                transform.TransformPoints([(lon_min, lat_min),
+                                           (lon_max, lat_max)])
 
         # Extract bands from gdal dataset
         nat_mem_path = '/vsimem/%s' % str(uuid.uuid4())
@@ -467,14 +459,14 @@ class HRRRProduct():
                                 self.gdal_ds,
                                 format='MEM',
                                 bandList=product_idx_list,
-                                outputSRS=o_srs.ExportToProj4(),
+                                outputSRS=_HRRR_LCC_PROJ4,
                                 noData='nan',
                                 callback=gdal.TermProgress)
 
         # Convert to destination coordinate system
         dst_mem_path = '/vsimem/%s' % str(uuid.uuid4())
         warp_options = dict[str, Any](format='MEM',
-                                      dstSRS=dst_srs.ExportToProj4(),
+                                      dstSRS=dst_proj4,
                                       srcNodata='nan',
                                       dstNodata='nan',
                                       callback=gdal.TermProgress)
@@ -688,4 +680,4 @@ class HRRRProduct():
         gdal_close_dataset(ds)
 
         # Return
-        return output
\ No newline at end of file
+        return output
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import re
-from datetime import datetime
-
-import pytz
+from datetime import datetime, timezone
 
 from . import HRRR_V1_INIT_TIME, HRRR_V2_INIT_TIME, HRRR_V3_INIT_TIME, HRRR_V4_INIT_TIME
 
+# Valid HRRR product IDs (matched in full, so e.g. 'subhourly' or 'sfc\n'
+# are rejected)
+_PRODUCT_ID_RE = re.compile(r'prs|nat|sfc|subh')
+
 
 def get_hrrr_version(run_time: datetime) -> int:
     """
@@ -24,7 +26,7 @@ def get_hrrr_version(run_time: datetime) -> int:
     """
     # Add UTC timezone if not specified
     if run_time.tzinfo is None:
-        run_time = run_time.replace(tzinfo=pytz.UTC)
+        run_time = run_time.replace(tzinfo=timezone.utc)
 
     if run_time > HRRR_V4_INIT_TIME:
         return 4
@@ -49,7 +51,7 @@ def validate_product_id(product_id: str) -> None:
     Raises:
         ValueError: If product ID is invalid.
     """
-    if not re.match('(prs|nat|sfc|subh)', product_id):
+    if not _PRODUCT_ID_RE.fullmatch(product_id):
         raise ValueError(
             'Invalid product ID: %s! Must be one of \'prs\', \'nat\', \'sfc\', \'subh\'.'
             % str(product_id))
\ No newline at end of file
@@ -6,7 +6,9 @@ https://github.com/blaylockbk/pyBKB_v2/blob/master/BB_cmap/NWS_standard_cmap.py
 """
 
 import numpy as np
-import matplotlib as mpl
+
+# matplotlib is imported within each function, so that importing fetchmrms
+# doesn't load it
 
 
 def mrms_rotation_cmap():
@@ -25,7 +27,8 @@ def mrms_rotation_cmap():
                     (221, 0, 0), (255, 0, 0), (0, 187, 187), (0, 255, 255)])
 
     # Create the colormap
-    cmap, norm = mpl.colors.from_levels_and_colors(
+    from matplotlib.colors import from_levels_and_colors
+    cmap, norm = from_levels_and_colors(
         a, rgb / 255., extend='max')     # type: ignore
 
     return cmap, norm
@@ -53,7 +56,8 @@ def mrms_refl_cmap():
                     (153, 85, 201)])
 
     # Create the colormap
-    cmap, norm = mpl.colors.from_levels_and_colors(
+    from matplotlib.colors import from_levels_and_colors
+    cmap, norm = from_levels_and_colors(
         a, rgb / 255., extend='max')     # type: ignore
 
     return cmap, norm
@@ -75,7 +79,8 @@ def mrms_shi_cmap():
                     (190, 85, 220), (126, 50, 167)])
 
     # Create the colormap
-    cmap, norm = mpl.colors.from_levels_and_colors(
+    from matplotlib.colors import from_levels_and_colors
+    cmap, norm = from_levels_and_colors(
         a, rgb / 255., extend='max')     # type: ignore
 
     return cmap, norm
@@ -97,7 +102,8 @@ def mrms_mesh_cmap():
                     (190, 85, 220), (126, 50, 167)])
 
     # Create the colormap
-    cmap, norm = mpl.colors.from_levels_and_colors(
+    from matplotlib.colors import from_levels_and_colors
+    cmap, norm = from_levels_and_colors(
         a, rgb / 255., extend='max')     # type: ignore
 
     return cmap, norm
\ No newline at end of file
@@ -4,37 +4,192 @@
 
 from __future__ import annotations
 
+import gzip
+import struct
+import glob
 import uuid
+import hashlib
 import pathlib
-from datetime import datetime
-from typing import Union, Tuple, Optional, Any
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Union, Tuple, Optional, Any, Iterator
 import numpy as np
 
-import pytz
-from osgeo import gdal, osr
-import matplotlib as mpl
-import matplotlib.image
-import matplotlib.pyplot as plt
+from osgeo import gdal
 
 from . import get_logger
 from .colormaps import mrms_mesh_cmap, mrms_rotation_cmap, mrms_refl_cmap, mrms_shi_cmap
-from ..utils import gdal_close_dataset
+from ..utils import get_coord_transform, gdal_close_dataset, srs_to_proj4
+
+# Output projections, built once at import
+_DST_PROJ4 = {
+    'world': srs_to_proj4('EPSG:4326'),
+    'map': srs_to_proj4('EPSG:3857'),
+}
+
+# In-memory reprojections, keyed by source file state + reprojection options.
+# Bounded so that repeated calls with new options do not grow /vsimem forever.
+_WARP_CACHE: dict[tuple, str] = {}
+_WARP_CACHE_MAXSIZE = 16
+
+
+def _cache_warp_result(key: tuple, path: str) -> None:
+    """
+    Store the /vsimem/ path of a reprojection in the warp cache, evicting
+    (and unlinking) the oldest entry if the cache is full.
+
+    Args:
+        key (tuple): Cache key
+        path (str): /vsimem/ path of the reprojected raster
+    """
+    _WARP_CACHE.pop(key, None)
+    while len(_WARP_CACHE) >= _WARP_CACHE_MAXSIZE:
+        old_path = _WARP_CACHE.pop(next(iter(_WARP_CACHE)))
+        if gdal.VSIStatL(old_path) is not None:
+            gdal.Unlink(old_path)
+    _WARP_CACHE[key] = path
+
+
+def _release_warp_result(ds: gdal.Dataset) -> None:
+    """
+    Release a dataset returned by MRMSProduct.reproject_to_geotiff. Cached
+    reprojections are kept in /vsimem/ for re-use; anything else is closed
+    and unlinked.
+
+    Args:
+        ds (gdal.Dataset): Reprojected dataset
+    """
+    if ds.GetDescription() not in _WARP_CACHE.values():
+        gdal_close_dataset(ds)
+
+
+@contextmanager
+def _gdal_exceptions() -> Iterator[None]:
+    """
+    Surface GDAL errors as Python exceptions within this context, restoring
+    the caller's previous GDAL exception mode on exit. GDAL's exception mode
+    is process-wide, so it is not enabled globally.
+    """
+    prev_use_exceptions = gdal.GetUseExceptions()
+    gdal.UseExceptions()
+    try:
+        yield
+    finally:
+        if not prev_use_exceptions:
+            gdal.DontUseExceptions()
+
+
+# In-memory copies of cutline datasets, keyed by source path + modification
+# time. Bounded like the warp cache, unlinking evicted copies.
+_CUTLINE_CACHE: dict[tuple[str, int], str] = {}
+_CUTLINE_CACHE_MAXSIZE = 8
+
+
+def _cutline_key(shapefile_path: Union[pathlib.Path, str]) -> tuple[str, int]:
+    """
+    Cache key for a cutline shapefile: its path and the latest modification
+    time of the shapefile and its sidecar files (.dbf, .shx, .prj, ...), so
+    edits to any of them are picked up.
+
+    Args:
+        shapefile_path (Union[pathlib.Path, str]): Path to cutline shapefile
+
+    Returns:
+        tuple[str, int]: (Shapefile path, latest modification time [ns])
+    """
+    shapefile_path = pathlib.Path(shapefile_path)
+    mtime_ns = max(
+        [shapefile_path.stat().st_mtime_ns] +
+        [e.stat().st_mtime_ns for e in shapefile_path.parent.glob(
+            glob.escape(shapefile_path.stem) + '.*')])
+    return str(shapefile_path), mtime_ns
+
+
+def _cutline_path(key: tuple[str, int]) -> str:
+    """
+    Copy a cutline vector dataset into /vsimem/ once, so repeated warps with
+    the same region mask don't re-read it from disk.
+
+    Args:
+        key (tuple[str, int]): Cutline cache key, from _cutline_key()
+
+    Returns:
+        str: /vsimem/ path of the cutline dataset
+    """
+    vsi_path = _CUTLINE_CACHE.get(key)
+    if vsi_path is not None and gdal.VSIStatL(vsi_path) is not None:
+        return vsi_path
+
+    vsi_path = '/vsimem/cutline_%s.fgb' % hashlib.md5(
+        ('%s:%d' % key).encode()).hexdigest()
+    # Shapefile "Polygon" layers may hold MultiPolygons, which FlatGeobuf
+    # rejects unless the layer type is promoted
+    with _gdal_exceptions():
+        gdal.VectorTranslate(vsi_path,
+                             key[0],
+                             format='FlatGeobuf',
+                             geometryType='PROMOTE_TO_MULTI')
+
+    _CUTLINE_CACHE.pop(key, None)
+    while len(_CUTLINE_CACHE) >= _CUTLINE_CACHE_MAXSIZE:
+        old_path = _CUTLINE_CACHE.pop(next(iter(_CUTLINE_CACHE)))
+        if gdal.VSIStatL(old_path) is not None:
+            gdal.Unlink(old_path)
+    _CUTLINE_CACHE[key] = vsi_path
+    return vsi_path
+
+
+def _read_grib2_reference_time(grib2_path: pathlib.Path,
+                               is_gz: bool) -> datetime:
+    """
+    Read the reference time of the first message in a GRIB2 file directly
+    from its Identification Section (Section 1), without decoding the rest
+    of the message. MRMS products are analyses, so this is also the
+    product's valid time.
+
+    Args:
+        grib2_path (pathlib.Path): Path to GRIB2 file
+        is_gz (bool): Whether or not the file is gzipped
+
+    Raises:
+        ValueError: If the file does not start with a GRIB2 message.
+
+    Returns:
+        datetime: Reference time (timezone aware, UTC)
+    """
+    # Section 0 is 16 bytes; the reference time is octets 13-19 of Section 1
+    with (gzip.open if is_gz else open)(grib2_path, 'rb') as f:
+        header = f.read(35)
+    if len(header) < 35 or header[:4] != b'GRIB' or header[7] != 2 or header[
+            20] != 1:
+        raise ValueError('Could not get timestamp from GRIB2 file!')
+    return datetime(*struct.unpack('>HBBBBB', header[28:35]),
+                    tzinfo=timezone.utc)
 
 
 class MRMSProduct:
     """ General class to load MRMS product files in GRIB2 format """
 
-    __slots__ = ['_valid_time', '_loc', '_gdal_ds', '_logger']
+    __slots__ = [
+        '_valid_time', '_loc', '_gdal_ds', '_gdal_ds_path', '_grib_metadata',
+        '_logger'
+    ]
 
-    def __init__(self, loc: Union[pathlib.Path, str], valid_time: datetime,
-                 gdal_ds: gdal.Dataset):
+    def __init__(self,
+                 loc: Union[pathlib.Path, str],
+                 valid_time: datetime,
+                 gdal_ds: Optional[gdal.Dataset] = None,
+                 gdal_ds_path: Optional[str] = None):
         """
-        Instantiate a MRMS Product from file path, valid time, and GDAL Dataset
+        Instantiate a MRMS Product from file path, valid time, and GDAL Dataset.
+        If no GDAL Dataset is given, it is opened on first access.
 
         Args:
             loc (Union[pathlib.Path, str]): location to the product on the timesystem
             valid_time (datetime): aware datetime of the product's valid time
-            gdal_ds (gdal.Dataset): gdal.Dataset for this product
+            gdal_ds (Optional[gdal.Dataset], optional): gdal.Dataset for this product. Defaults to None.
+            gdal_ds_path (Optional[str], optional): GDAL path to open the dataset from (ex. /vsigzip/...),
+                if gdal_ds is not given. Defaults to loc.
 
         Raises:
             ValueError: if the valid time isn't an aware datetime object
@@ -44,6 +199,12 @@ class MRMSProduct:
         if self._valid_time.tzinfo is None:
             raise ValueError('Valid time must be contain tzinfo!')
         self._gdal_ds = gdal_ds
+        # Left as None if a dataset was given, since it is never re-opened
+        # (and may not correspond to a file at loc)
+        self._gdal_ds_path = gdal_ds_path
+        if gdal_ds is None and gdal_ds_path is None:
+            self._gdal_ds_path = str(self._loc)
+        self._grib_metadata = None     # type: Optional[dict]
         self._logger = get_logger()
 
     @property
@@ -55,39 +216,69 @@ class MRMSProduct:
         return self._valid_time
 
     @property
-    def gdal_ds(self):
+    def gdal_ds(self) -> gdal.Dataset:
+        """
+        GDAL Dataset for this product. Opened on first access.
+
+        Raises:
+            RuntimeError: If the dataset could not be opened.
+
+        Returns:
+            gdal.Dataset: GDAL Dataset
+        """
+        if self._gdal_ds is None:
+            try:
+                with _gdal_exceptions():
+                    self._gdal_ds = gdal.Open(self._gdal_ds_path)
+            except RuntimeError as e:
+                raise RuntimeError(
+                    'Dataset invalid! Cannot load MRMS product.') from e
         return self._gdal_ds
 
     def get_grib_metadata(self) -> dict:
         """
-        Returns the metadata dictionary for this GRIB2 file
+        Returns the metadata dictionary for this GRIB2 file.
+        Fetched from the dataset on first call, then persisted.
 
         Returns:
             dict: GRIB2 metadata dict
         """
-        band = self.gdal_ds.GetRasterBand(1)
-        meta = band.GetMetadata()
-        band = None
-        return meta
-
-    def reproject_to_geotiff(
-            self,
-            proj: str = 'world',
-            bounds: Optional[Tuple[float, float, float, float]] = None,
-            shapefile: Optional[Union[pathlib.Path, str]] = None,
-            save_path: Optional[Union[pathlib.Path,
-                                      str]] = None) -> gdal.Dataset:
+        if self._grib_metadata is None:
+            band = self.gdal_ds.GetRasterBand(1)
+            self._grib_metadata = band.GetMetadata()
+            band = None
+        return self._grib_metadata
+
+    def reproject_to_geotiff(self,
+                             proj: str = 'world',
+                             bounds: Optional[Tuple[float, float, float,
+                                                    float]] = None,
+                             shapefile: Optional[Union[pathlib.Path,
+                                                       str]] = None,
+                             save_path: Optional[Union[pathlib.Path,
+                                                       str]] = None,
+                             error_threshold: float = 0.125,
+                             verbose: bool = False) -> gdal.Dataset:
         """
-        Reproject the product to a GeoTIFF Raster
+        Reproject the product to a GeoTIFF Raster. The output is a Cloud
+        Optimized GeoTIFF (tiled, with internal overviews).
+
+        In-memory reprojections (no save_path) are cached by source file and
+        reprojection options, so repeated calls for the same product re-use the
+        existing raster instead of warping again. Products created from an
+        existing GDAL dataset, or whose file is not on disk, are not cached.
 
         Args:
             proj (str, optional): Raster projection: 'map' (EPSG:3857) or 'world' (EPSG:4326). Defaults to 'world'.
             bounds (Optional[Tuple[float, float, float, float]], optional): Bounding box in the form (lon_min, lat_min, lon_max, lat_max). Defaults to None.
             shapefile (Optional[Union[pathlib.Path, str]], optional): Path to shapefile to cut to. If bounds is also provided, it will be unused. Defaults to None.
             save_path (Optional[Union[pathlib.Path, str]], optional): Optional save path of the output GeoTIFF raster. Defaults to None.
+            error_threshold (float, optional): Error threshold [px] for the approximate transformer used by the warp. 0 uses the exact transformer. Defaults to 0.125.
+            verbose (bool, optional): Whether or not to print GDAL progress to the terminal. Defaults to False.
 
         Raises:
             ValueError: if proj isn't 'world' or 'map'
+            RuntimeError: if GDAL fails to reproject the product
 
         Returns:
             gdal.Dataset: GDAL dataset of the reprojected raster
@@ -99,60 +290,101 @@ class MRMSProduct:
             )
             bounds = None
 
+        # Cutline path + modification time, so edits to it are picked up
+        cutline_key = _cutline_key(shapefile) if shapefile is not None else None
+
+        # Re-use a previous in-memory reprojection of the same file, if there
+        # is one. Only products opened from a file on disk are cached.
+        cache_key = None
+        if (save_path is None and self._gdal_ds_path is not None
+                and self._loc.exists()):
+            cache_key = (str(self._loc), self._loc.stat().st_mtime_ns, proj,
+                         tuple(bounds) if bounds is not None else None,
+                         cutline_key, error_threshold)
+            cached_path = _WARP_CACHE.get(cache_key)
+            if cached_path is not None and gdal.VSIStatL(
+                    cached_path) is not None:
+                self._logger.debug('Re-using cached reprojection: %s' %
+                                   cached_path)
+                return gdal.Open(cached_path)
+
         # Parse bounds
         if bounds is not None:
             lon_min, lat_min, lon_max, lat_max = bounds
         else:
             lon_min = lat_min = lon_max = lat_max = None
 
-        # Setup src coordinate system
-        # Lambert Conformal Conic Projection
-        o_srs = osr.SpatialReference()
-        o_srs.ImportFromWkt(self.gdal_ds.GetProjection())
-        assert len(o_srs.ExportToProj4())
-
-        # Setup destination coordinate system
-        dst_srs = osr.SpatialReference()
-        if proj == 'world':
-            dst_srs.ImportFromEPSG(4326)
-        elif proj == 'map':
-            dst_srs.ImportFromEPSG(3857)
-
-            # If map... transform bounds to meters
-            if bounds is not None:
-                wgs84_srs = osr.SpatialReference()
-                wgs84_srs.ImportFromEPSG(4326)
-                transform = osr.CoordinateTransformation(wgs84_srs, dst_srs)
-                # NOTE: WGS-84 need to be in the form of lat, lon (not lon, lat) for some reason
-                (lon_min, lat_min, _), (lon_max, lat_max, _) = [
-                    transform.TransformPoint(*e)
-                    for e in ((lat_min, lon_min), (lat_max, lon_max))
-                ]
-        else:
+        # Get destination coordinate system
+        dst_proj4 = _DST_PROJ4.get(proj)
+        if dst_proj4 is None:
             raise ValueError('Projection must be \'world\' or \'map\'!')
-        assert len(dst_srs.ExportToWkt())
-
-        # Set reprojection options
-        dst_ds_path = str(
-            save_path) if save_path is not None else '/vsimem/%s.tif' % str(
-                uuid.uuid4())
-        warp_options = dict[str, Any](format='GTiff',
-                                      dstSRS=dst_srs.ExportToProj4(),
-                                      srcNodata='nan',
-                                      dstNodata='nan',
-                                      callback=gdal.TermProgress)
+
+        # If map... transform bounds to meters
+        if proj == 'map' and bounds is not None:
+            transform = get_coord_transform('EPSG:4326', 'EPSG:3857')
+            (lon_min, lat_min, _), (lon_max, lat_max, _) = \
+                transform.TransformPoints([(lon_min, lat_min),
+                                           (lon_max, lat_max)])
+
+        # Set reprojection options. The warp itself only builds a warped VRT,
+        # so no pixels are resampled until the translate below, which only
+        # requests the output window.
+        if save_path is not None:
+            dst_ds_path = str(save_path)
+        elif cache_key is not None:
+            dst_ds_path = '/vsimem/mrms_%s.tif' % hashlib.md5(
+                repr(cache_key).encode()).hexdigest()
+        else:
+            dst_ds_path = '/vsimem/mrms_%s.tif' % uuid.uuid4().hex
+        warp_options = dict[str,
+                            Any](format='VRT',
+                                 dstSRS=dst_proj4,
+                                 srcNodata='nan',
+                                 dstNodata='nan',
+                                 errorThreshold=error_threshold,
+                                 multithread=True,
+                                 warpMemoryLimit=512 << 20,
+                                 warpOptions=[
+                                     'NUM_THREADS=ALL_CPUS',
+                                     'SKIP_NOSOURCE=YES', 'INIT_DEST=NO_DATA'
+                                 ])
+        translate_options = dict[str, Any](
+            format='COG',
+            creationOptions=[
+                'BLOCKSIZE=512', 'COMPRESS=DEFLATE', 'OVERVIEWS=AUTO',
+                'RESAMPLING=AVERAGE', 'NUM_THREADS=ALL_CPUS'
+            ],
+            callback=gdal.TermProgress if verbose else None)
 
         # Bounds-specific options
         if bounds is not None:
-            warp_options['outputBounds'] = [lon_min, lat_min, lon_max, lat_max]
+            translate_options['projWin'] = [lon_min, lat_max, lon_max, lat_min]
 
         # Shapefile cutline specific options
         if shapefile is not None:
-            warp_options['cutlineDSName'] = str(shapefile)
+            warp_options['cutlineDSName'] = _cutline_path(cutline_key)
             warp_options['cropToCutline'] = True
 
-        self._logger.info('Reprojecting dataset...')
-        dst_ds = gdal.Warp(dst_ds_path, self.gdal_ds, **warp_options)
+        # Bump the GDAL block cache for the warp, restoring it afterwards.
+        # The GDAL_CACHEMAX config option is only read when the cache is
+        # first initialised, so set the cache size directly.
+        prev_cachemax = gdal.GetCacheMax()
+        gdal.SetCacheMax(max(prev_cachemax, 1024 << 20))
+        try:
+            self._logger.info('Reprojecting dataset...')
+            with _gdal_exceptions():
+                vrt_ds = gdal.Warp('', self.gdal_ds, **warp_options)
+                dst_ds = gdal.Translate(dst_ds_path, vrt_ds,
+                                        **translate_options)
+            vrt_ds = None
+        except RuntimeError as e:
+            raise RuntimeError('Failed to reproject MRMS product: %s' %
+                               e) from e
+        finally:
+            gdal.SetCacheMax(prev_cachemax)
+
+        if cache_key is not None:
+            _cache_warp_result(cache_key, dst_ds_path)
 
         return dst_ds
 
@@ -179,21 +411,44 @@ class MRMSProduct:
         Returns:
             Tuple[Any, Any]: Matplotlib figure and axis object
         """
+        # Imported here so that importing this module doesn't load matplotlib
+        import matplotlib.cm
+        import matplotlib.pyplot as plt
+
         ds = self.reproject_to_geotiff(**reproj_kwargs)
         metadata = self.get_grib_metadata()
-        band = ds.GetRasterBand(1)
-        im = band.ReadAsArray()
         fig, ax = plt.subplots()
+
+        # Start from the coarsest overview that still covers the figure's pixel size
+        fig_w, fig_h = int(fig.get_figwidth() * fig.dpi), int(
+            fig.get_figheight() * fig.dpi)
+        band = ds.GetRasterBand(1)
+        read_band, ovr_band = band, None
+        for i in range(band.GetOverviewCount()):
+            ovr_band = band.GetOverview(i)
+            if ovr_band.XSize < fig_w or ovr_band.YSize < fig_h:
+                break
+            read_band = ovr_band
+
+        # Resample down to (about) the figure's pixel size while reading
+        scale = min(1.0, max(fig_w / read_band.XSize, fig_h / read_band.YSize))
+        im = read_band.ReadAsArray(
+            buf_xsize=max(1, round(read_band.XSize * scale)),
+            buf_ysize=max(1, round(read_band.YSize * scale)),
+            resample_alg=gdal.GRIORA_Average)
+        read_band = ovr_band = None
+
         ax.imshow(im, cmap=cmap, norm=norm)
         fig.colorbar(
-            mpl.cm.ScalarMappable(norm=norm, cmap=cmap),     # type: ignore
+            matplotlib.cm.ScalarMappable(norm=norm, cmap=cmap),     # type: ignore
             ax=ax,
             label=metadata.get('GRIB_UNIT', ''))
         ax.set_title(
             f"{metadata.get('GRIB_COMMENT', 'Unknown Product')}\nValid Time: {self.valid_time.isoformat()}"
         )
         band = None
-        gdal_close_dataset(ds)
+        _release_warp_result(ds)
+        ds = None
         return fig, ax
 
     def plot_default(self, **reproj_kwargs) -> Tuple[Any, Any]:
@@ -225,9 +480,11 @@ class MRMSProduct:
         im = band.ReadAsArray()
         rgb_im = cmap(norm(im))
         if save_path is not None:
+            import matplotlib.image
             matplotlib.image.imsave(str(save_path), rgb_im)
         band = None
-        gdal_close_dataset(ds)
+        _release_warp_result(ds)
+        ds = None
         return rgb_im
 
     def to_png_raster_default(self, save_path: Optional[Union[pathlib.Path,
@@ -251,6 +508,9 @@ class MRMSProduct:
         Create an instance of this class from a GRIB2 file. This is the preferred way
         of instantiating this class.
 
+        Only the GRIB2 header is read here; the GDAL dataset is opened on first use,
+        so many products can be created (and filtered by valid time) cheaply.
+
         Args:
             grib2_path (Union[pathlib.Path, str]): Path to a MRMS GRIB2 file
 
@@ -276,21 +536,15 @@ class MRMSProduct:
             raise ValueError('Input file must be a GRIB2 file! %s' %
                              str(grib2_path))
 
-        # Get GDAL Dataset
-        ds = gdal.Open(('/vsigzip/' if is_gz else '') + str(grib2_path))
-        if ds is None:
-            raise RuntimeError('Dataset invalid! Cannot load MRMS product.')
-
-        # Get Unix timestamp
-        band = ds.GetRasterBand(1)
-        ts: Optional[str] = band.GetMetadata().get('GRIB_VALID_TIME')
-        band = None
-        if ts is None:
-            raise ValueError('Could not get timestamp from GRIB2 file!')
-        ts_dt = datetime.fromtimestamp(int(
-            ts.strip().split(' ')[0])).astimezone(pytz.UTC)
+        # Get valid time from the GRIB2 header, which avoids having GDAL
+        # decode the band metadata
+        ts_dt = _read_grib2_reference_time(grib2_path, is_gz)
 
-        return cls(loc=grib2_path, valid_time=ts_dt, gdal_ds=ds)
+        # The GDAL dataset is not opened until needed
+        return cls(loc=grib2_path,
+                   valid_time=ts_dt,
+                   gdal_ds_path=('/vsigzip/' if is_gz else '') +
+                   str(grib2_path))
 
 
 class MRMSRotationProduct(MRMSProduct):
@@ -330,4 +584,4 @@ class MRMSMaximumExpectedSizeOfHailProduct(MRMSProduct):
         """
         Get default matplotlib colormap and norm objects for this MRMS product.
         """
-        return mrms_mesh_cmap()
\ No newline at end of file
+        return mrms_mesh_cmap()
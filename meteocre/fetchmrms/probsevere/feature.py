@@ -4,16 +4,28 @@
 
 from __future__ import annotations
 from datetime import datetime
+import sys
 import json
 import math
-from typing import List, Tuple, Dict, Union
+from types import MappingProxyType
+from typing import List, Mapping, Sequence, Tuple, Dict, Union
 from typing import Optional     #noqa
 from functools import cache
 
+import numpy as np
 from osgeo import ogr, osr
 
+from ...utils import get_coord_transform
+
+# Use orjson to parse feature native data if it is available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Feature descriptions, including units
-FEATURE_DESC: Dict[str, str] = {
+FEATURE_DESC: Mapping[str, str] = {
     "ID":
     "the object ID number of this storm object. This will help link together storm objects through time.",
     "MUCAPE":
@@ -63,6 +75,42 @@ FEATURE_DESC: Dict[str, str] = {
     "MOTION_SOUTH":
     "the southward or norther motion for this storm, in units of m/s (values < 0 mean northward/southerly motion). ",
 }
+# Make read-only, interning the keys since the same keys are looked up
+# across every feature
+FEATURE_DESC = MappingProxyType(
+    {sys.intern(k): v
+     for k, v in FEATURE_DESC.items()})
+
+
+def _srs_user_input(srs: osr.SpatialReference) -> str:
+    """
+    Get a compact user-input string for a spatial reference: its authority
+    code if it has one (ex. 'EPSG:4326'), otherwise its WKT.
+
+    Args:
+        srs (osr.SpatialReference): Spatial reference
+
+    Returns:
+        str: User-input string for the spatial reference
+    """
+    auth_name, auth_code = srs.GetAuthorityName(None), srs.GetAuthorityCode(
+        None)
+    if auth_name and auth_code:
+        return '%s:%s' % (auth_name, auth_code)
+    return srs.ExportToWkt()
+
+
+def _model_lines(model_data: Dict[str, str]) -> str:
+    """
+    Join the message lines ('LINE*' keys, in file order) of a ProbSevere model.
+
+    Args:
+        model_data (Dict[str, str]): Model data from the feature's native data
+
+    Returns:
+        str: Model message
+    """
+    return '\n'.join(v for k, v in model_data.items() if k[:4] == 'LINE')
 
 
 class ProbSevereFeature:
@@ -70,7 +118,9 @@ class ProbSevereFeature:
     __slots__ = [
         '_feat_id', '_ogr_poly', '_valid_time', '_probsevere', '_probtor',
         '_probhail', '_probwind', '_probsevere_msg', '_probtor_msg',
-        '_probhail_msg', '_probwind_msg', '_properties'
+        '_probhail_msg', '_probwind_msg', '_properties', '_prop_float',
+        '_prop_str', '_v_south', '_v_east', '_speed', '_bearing', '_area_km2',
+        '_perim_km'
     ]
 
     def __init__(self, feat_id: int, ogr_poly: ogr.Geometry,
@@ -119,13 +169,35 @@ class ProbSevereFeature:
         self._probhail_msg = kwargs.get('probhail_msg', '')     # type: str
         self._probwind_msg = kwargs.get('probwind_msg', '')     # type: str
 
-        # Properties
-        self._properties = kwargs.get('properties',
-                                      {})     # type: Dict[str, str]
+        # Properties (copied, so later changes by the caller can't desync the
+        # typed lookups below). Kept as a plain dict so features pickle;
+        # the properties getter hands out a read-only view.
+        self._properties = dict(kwargs.get('properties',
+                                           {}))     # type: Dict[str, str]
+
+        # Properties split by type, casting to float once if possible
+        self._prop_float = {}     # type: Dict[str, float]
+        self._prop_str = {}     # type: Dict[str, str]
+        for k, v in self._properties.items():
+            try:
+                self._prop_float[k] = float(v)
+            except (TypeError, ValueError):
+                self._prop_str[k] = v
+
+        # Motion (NaN if not provided), and derived speed / bearing
+        self._v_south = self._prop_float.get('MOTION_SOUTH', math.nan)
+        self._v_east = self._prop_float.get('MOTION_EAST', math.nan)
+        self._speed = math.hypot(self._v_south, self._v_east)
+        self._bearing = math.degrees(math.atan2(self._v_south,
+                                                self._v_east)) + 90.0
 
         # Valid time
         self._valid_time = valid_time
 
+        # Area / perimeter, not computed until needed
+        self._area_km2 = None     # type: Optional[float]
+        self._perim_km = None     # type: Optional[float]
+
     def __str__(self) -> str:
         return '<%s; ID: %d; ProbSevere: %d%%; ProbTor: %d%%; ProbHail: %d%%; ProbWind: %d%%>' % (
             self.__class__.__name__, self.feat_id, self.probsevere,
@@ -166,12 +238,10 @@ class ProbSevereFeature:
         Returns:
             ogr.Geometry: OGR Equal Area Polygon Geometry object
         """
-        # Create coordinate transformation object from source SRS -> EPSG:6933
-        src_srs = self.ogr_poly.GetSpatialReference()
-        dst_srs = osr.SpatialReference()
-        dst_srs.ImportFromEPSG(
-            6933)     # cyclindrical equal-area projection (units: m)
-        xform = osr.CoordinateTransformation(src_srs, dst_srs)
+        # Get coordinate transformation object from source SRS -> EPSG:6933
+        # (cyclindrical equal-area projection, units: m)
+        xform = get_coord_transform(
+            _srs_user_input(self.ogr_poly.GetSpatialReference()), 'EPSG:6933')
 
         # Compute equal-area polygon from current polygon.
         ogr_poly_eq_area = self._ogr_poly.Clone()
@@ -214,12 +284,12 @@ class ProbSevereFeature:
     def velocity(self) -> Tuple[float, float]:
         """
         Feature southward and eastward velocity. Units of m/s.
+        NaN if the feature has no motion properties.
 
         Returns:
             Tuple[float, float]: (Southward velocity in m/s, Eastword velocity in m/s)
         """
-        return self.get_property('MOTION_SOUTH'), self.get_property(
-            'MOTION_EAST')     # type: ignore
+        return self._v_south, self._v_east
 
     @property
     def speed(self) -> float:
@@ -229,8 +299,7 @@ class ProbSevereFeature:
         Returns:
             float: Feature speed in m/s
         """
-        v_south, v_east = self.velocity
-        return (v_south**2 + v_east**2)**0.5
+        return self._speed
 
     @property
     def bearing(self) -> float:
@@ -241,8 +310,7 @@ class ProbSevereFeature:
         Returns:
             float: Feature bearing in degrees.
         """
-        v_south, v_east = self.velocity
-        return math.degrees(math.atan2(v_south, v_east)) + 90.0
+        return self._bearing
 
     @property
     def area(self) -> float:
@@ -252,7 +320,9 @@ class ProbSevereFeature:
         Returns:
             float: Feature area in km^2
         """
-        return self.ogr_poly_eq_area.GetArea() * 1e-6
+        if self._area_km2 is None:
+            self._area_km2 = self.ogr_poly_eq_area.GetArea() * 1e-6
+        return self._area_km2
 
     @property
     def perimeter(self) -> float:
@@ -262,7 +332,9 @@ class ProbSevereFeature:
         Returns:
             float: Feature perimeter in km
         """
-        return self.ogr_poly_eq_area.Boundary().Length() * 1e-3
+        if self._perim_km is None:
+            self._perim_km = self.ogr_poly_eq_area.Boundary().Length() * 1e-3
+        return self._perim_km
 
     @property
     def probsevere(self) -> int:
@@ -305,14 +377,14 @@ class ProbSevereFeature:
         return self._probwind
 
     @property
-    def properties(self) -> Dict[str, str]:
+    def properties(self) -> Mapping[str, str]:
         """
         Other feature properties (thermodynamic / kinematic environment, lightning flash density, etc)
 
         Returns:
-            Dict[str, str]: Other feature properties (copied)
+            Mapping[str, str]: Other feature properties (read-only view)
         """
-        return self._properties.copy()
+        return MappingProxyType(self._properties)
 
     def get_property(self, key: str) -> Union[float, str]:
         """
@@ -324,12 +396,8 @@ class ProbSevereFeature:
         Returns:
             Union[float, str]: Property value (float if castable, else str)
         """
-        v = self._properties[key]
-        # Try to cast to float if possible
-        try:
-            return float(v)
-        except ValueError:
-            return v
+        v = self._prop_float.get(key)
+        return v if v is not None else self._prop_str[key]
 
     def get_description(self, key: str) -> str:
         """
@@ -372,6 +440,111 @@ class ProbSevereFeature:
                 raise ValueError('Unknown filter: %s' % repr(f))
         return '\n\n'.join(msg_list)
 
+    @staticmethod
+    def bulk_metrics(
+        features: Sequence[ProbSevereFeature]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute area and perimeter for many features at once. All polygon rings
+        are reprojected to EPSG:6933 in a single transformation call and
+        measured with NumPy. Results are persisted on each feature, so later
+        calls to `area` / `perimeter` are free.
+
+        Features without any points (empty polygons) get NaN area and perimeter.
+
+        Args:
+            features (Sequence[ProbSevereFeature]): Features to compute metrics for
+
+        Raises:
+            ValueError: If a feature's geometry is not a polygon, or features
+                do not share the same spatial reference.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (Areas in km^2, Perimeters in km)
+        """
+        if not len(features):
+            return np.empty(0), np.empty(0)
+
+        # Gather every ring of every polygon into one flat list of points
+        srs = features[0].ogr_poly.GetSpatialReference()
+        pts = []     # type: List[Tuple[float, float]]
+        ring_starts, ring_feat_idx, ring_is_hole = [], [], []
+        for feat_idx, f in enumerate(features):
+            if ogr.GT_Flatten(f.ogr_poly.GetGeometryType()) != ogr.wkbPolygon:
+                raise ValueError('Feature geometry must be a polygon! Got: %s' %
+                                 f.ogr_poly.GetGeometryName())
+            f_srs = f.ogr_poly.GetSpatialReference()
+            if (f_srs is None) != (srs is None) or (srs is not None
+                                                    and not f_srs.IsSame(srs)):
+                raise ValueError(
+                    'All features must share the same spatial reference!')
+            for ring_idx in range(f.ogr_poly.GetGeometryCount()):
+                ring_pts = f.ogr_poly.GetGeometryRef(ring_idx).GetPoints()
+                if not ring_pts:
+                    continue
+                ring_starts.append(len(pts))
+                ring_feat_idx.append(feat_idx)
+                ring_is_hole.append(ring_idx > 0)
+                pts.extend(p[:2] for p in ring_pts)
+
+        # Nothing to measure
+        if not pts:
+            nan = np.full(len(features), np.nan)
+            return nan, nan.copy()
+
+        # Reproject all points to equal-area coordinates at once
+        xform = get_coord_transform(_srs_user_input(srs), 'EPSG:6933')
+        xy = np.array(xform.TransformPoints(pts))
+        x, y = xy[:, 0], xy[:, 1]
+
+        # Per-segment shoelace terms and lengths. Rings are closed, so
+        # segments spanning two rings are zeroed out.
+        seg_cross = np.append(x[:-1] * y[1:] - x[1:] * y[:-1], 0.0)
+        seg_len = np.append(np.hypot(np.diff(x), np.diff(y)), 0.0)
+        ring_starts_ar = np.array(ring_starts)
+        seg_cross[ring_starts_ar[1:] - 1] = 0.0
+        seg_len[ring_starts_ar[1:] - 1] = 0.0
+
+        # Sum per ring, then per feature (holes subtract from area)
+        ring_area = 0.5 * np.abs(np.add.reduceat(seg_cross, ring_starts_ar))
+        ring_area[np.array(ring_is_hole)] *= -1.0
+        ring_perim = np.add.reduceat(seg_len, ring_starts_ar)
+        area = np.bincount(
+            ring_feat_idx, weights=ring_area, minlength=len(features)) * 1e-6
+        perim = np.bincount(
+            ring_feat_idx, weights=ring_perim, minlength=len(features)) * 1e-3
+        no_rings = np.bincount(ring_feat_idx, minlength=len(features)) == 0
+        area[no_rings] = perim[no_rings] = np.nan
+
+        # Persist on each feature
+        for f, f_area, f_perim in zip(features, area, perim):
+            f._area_km2, f._perim_km = float(f_area), float(f_perim)
+
+        return area, perim
+
+    @staticmethod
+    def bulk_speed_bearing(
+        features: Sequence[ProbSevereFeature]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute speed and bearing for many features at once with NumPy.
+
+        Args:
+            features (Sequence[ProbSevereFeature]): Features to compute motion for
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (Speeds in m/s, Bearings in degrees)
+        """
+        v_south = np.fromiter((f._v_south for f in features),
+                              dtype=float,
+                              count=len(features))
+        v_east = np.fromiter((f._v_east for f in features),
+                             dtype=float,
+                             count=len(features))
+        speed = np.hypot(v_south, v_east)
+        bearing = np.degrees(np.arctan2(v_south, v_east)) + 90.0
+        return speed, bearing
+
     @classmethod
     def from_ogr_feature(cls, valid_time: datetime,
                          feat: ogr.Feature) -> ProbSevereFeature:
@@ -389,39 +562,27 @@ class ProbSevereFeature:
         ogr_poly = feat.GetGeometryRef().Clone()
 
         # Get native data
-        native_data = json.loads(str(feat.GetNativeData()))
+        native_data = _json_loads(str(feat.GetNativeData()))
 
         # Process probsevere
         probsevere_data = native_data['models']['probsevere']
         probsevere = int(probsevere_data['PROB'])
-        probsevere_msg = '\n'.join([
-            probsevere_data[e] for e in probsevere_data.keys()
-            if e.startswith('LINE')
-        ])
+        probsevere_msg = _model_lines(probsevere_data)
 
         # Process probtor
         probtor_data = native_data['models']['probtor']
         probtor = int(probtor_data['PROB'])
-        probtor_msg = '\n'.join([
-            probtor_data[e] for e in probtor_data.keys()
-            if e.startswith('LINE')
-        ])
+        probtor_msg = _model_lines(probtor_data)
 
         # Process probhail
         probhail_data = native_data['models']['probhail']
         probhail = int(probhail_data['PROB'])
-        probhail_msg = '\n'.join([
-            probhail_data[e] for e in probhail_data.keys()
-            if e.startswith('LINE')
-        ])
+        probhail_msg = _model_lines(probhail_data)
 
         # Process probwind
         probwind_data = native_data['models']['probwind']
         probwind = int(probwind_data['PROB'])
-        probwind_msg = '\n'.join([
-            probwind_data[e] for e in probwind_data.keys()
-            if e.startswith('LINE')
-        ])
+        probwind_msg = _model_lines(probwind_data)
 
         # Get properties
         properties = native_data['properties']
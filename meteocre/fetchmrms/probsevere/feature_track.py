@@ -3,19 +3,36 @@
 """ Class to describe a single ProbSevere feature over a time series """
 
 from __future__ import annotations
+import struct
 from datetime import datetime
-from typing import List, Tuple
-from functools import cache
+from typing import List
+from typing import Dict, Optional     #noqa
+from functools import cached_property
+from operator import attrgetter
 
+import numpy as np
 from osgeo import ogr
 
 from .feature import ProbSevereFeature
 
+# Per-feature values for a track, stored as one structured array. Area is
+# kept separate, since it needs an equal-area reprojection of every polygon.
+_TRACK_DTYPE = np.dtype([('centroid', 'f8', (2, )), ('speed', 'f8'),
+                         ('bearing', 'f8'), ('probsevere', 'i2'),
+                         ('probtor', 'i2'), ('probhail', 'i2'),
+                         ('probwind', 'i2')])
+
+# Fetches the per-feature attributes of _TRACK_DTYPE in one call
+_get_track_attrs = attrgetter('centroid', 'speed', 'bearing', 'probsevere',
+                              'probtor', 'probhail', 'probwind')
+_get_valid_time = attrgetter('valid_time')
+
 
 class ProbSevereFeatureTrack:
     """ Class to describe a single ProbSevere feature over a time series """
 
-    __slots__ = ['feat_id', '_feature_list']
+    # __dict__ is needed for cached_property
+    __slots__ = ['feat_id', '_feature_list', '_arr', '_prop_cache', '__dict__']
 
     def __init__(self,
                  feat_id: int,
@@ -24,15 +41,17 @@ class ProbSevereFeatureTrack:
         self.feat_id = feat_id
         if validate:
             for f in feature_list:
-                if not f.__class__ == ProbSevereFeature:
+                if type(f) is not ProbSevereFeature:
                     raise ValueError(
                         'Each item in feature list must be of class ProbSevereFeature! Got %s'
-                        % f.__class__.__name__)
-                if not f.feat_id == feat_id:
+                        % type(f).__name__)
+                if f.feat_id != feat_id:
                     raise ValueError(
                         'Feature ID mismatch in list! Got %d. Expected %d.' %
                         (f.feat_id, feat_id))
         self._feature_list = feature_list
+        self._arr = None     # type: Optional[np.ndarray]
+        self._prop_cache = {}     # type: Dict[str, List[float]]
 
     def __str__(self):
         return '<%s; ID: %d; Features: %d; Valid Times: %s -> %s>' % (
@@ -52,16 +71,37 @@ class ProbSevereFeatureTrack:
     def __add__(self,
                 other: ProbSevereFeatureTrack,
                 validate: bool = True) -> ProbSevereFeatureTrack:
-        if other.__class__ != ProbSevereFeatureTrack:
+        if type(other) is not ProbSevereFeatureTrack:
             raise ValueError('Cannot to add to object of class %s!' %
-                             other.__class__.__name__)
+                             type(other).__name__)
         if validate and other.feat_id != self.feat_id:
             raise ValueError('Feature ID mismatch between classes!')
-        return self.__class__(self.feat_id,
-                              self._feature_list + other._feature_list)
+        track = self.__class__(self.feat_id,
+                               self._feature_list + other._feature_list)
 
-    @property
-    @cache
+        # Re-use per-feature arrays if both sides have already built them
+        if self._arr is not None and other._arr is not None:
+            track._arr = np.concatenate([self._arr, other._arr])
+            track._arr.flags.writeable = False
+        return track
+
+    def _get_arr(self) -> np.ndarray:
+        """
+        Structured array of per-feature values for this track, built in a
+        single pass over the feature list on first call, then persisted.
+        Read-only, since the trend properties return views into it.
+
+        Returns:
+            np.ndarray: Structured array (see _TRACK_DTYPE)
+        """
+        if self._arr is None:
+            arr = np.array(list(map(_get_track_attrs, self._feature_list)),
+                           dtype=_TRACK_DTYPE)
+            arr.flags.writeable = False
+            self._arr = arr
+        return self._arr
+
+    @cached_property
     def valid_times(self) -> List[datetime]:
         """
         Valid times for this track
@@ -69,101 +109,94 @@ class ProbSevereFeatureTrack:
         Returns:
             List[datetime]: Valid times for this track
         """
-        return [e.valid_time for e in self._feature_list]
+        return list(map(_get_valid_time, self._feature_list))
 
     @property
-    @cache
-    def centroids(self) -> List[Tuple[float, float]]:
+    def centroids(self) -> np.ndarray:
         """
-        Centroids for this track
+        Centroids for this track, as an (N, 2) array of (lon, lat)
 
         Returns:
-            List[Tuple[float, float]]: Centroids for this track
+            np.ndarray: Centroids for this track
         """
-        return [e.centroid for e in self._feature_list]
+        return self._get_arr()['centroid']
 
     @property
-    @cache
-    def speed_list(self) -> List[float]:
+    def speed_list(self) -> np.ndarray:
         """
         List of speeds for this track
 
         Returns:
-            List[float]: List of speeds for this track
+            np.ndarray: List of speeds for this track
         """
-        return [e.speed for e in self._feature_list]
+        return self._get_arr()['speed']
 
     @property
-    @cache
-    def bearing_list(self) -> List[float]:
+    def bearing_list(self) -> np.ndarray:
         """
         List of bearings (degrees) for this track
 
         Returns:
-            List[float]: List of bearings (degrees) for this track
+            np.ndarray: List of bearings (degrees) for this track
         """
-        return [e.bearing for e in self._feature_list]
+        return self._get_arr()['bearing']
 
-    @property
-    @cache
-    def area_list(self) -> List[float]:
+    @cached_property
+    def area_list(self) -> np.ndarray:
         """
-        List of areas [km^2] for this track
+        List of areas [km^2] for this track. Computed on first call, then persisted.
 
         Returns:
-            List[float]: List of areas [km^2] for this track
+            np.ndarray: List of areas [km^2] for this track
         """
-        return [e.area for e in self._feature_list]
+        areas, _ = ProbSevereFeature.bulk_metrics(self._feature_list)
+        areas.flags.writeable = False
+        return areas
 
     @property
-    @cache
-    def probsevere_trend(self) -> List[int]:
+    def probsevere_trend(self) -> np.ndarray:
         """
         Trend of probability of severe weather [%] values for this track
 
         Returns:
-            List[int]: Trend of probability of severe weather [%] values for this track
+            np.ndarray: Trend of probability of severe weather [%] values for this track
         """
-        return [e.probsevere for e in self._feature_list]
+        return self._get_arr()['probsevere']
 
     @property
-    @cache
-    def probtor_trend(self) -> List[int]:
+    def probtor_trend(self) -> np.ndarray:
         """
         Trend of probability of a tornado [%] values for this track
 
         Returns:
-            List[int]: Trend of probability of a tornado [%] values for this track
+            np.ndarray: Trend of probability of a tornado [%] values for this track
         """
-        return [e.probtor for e in self._feature_list]
+        return self._get_arr()['probtor']
 
     @property
-    @cache
-    def probhail_trend(self) -> List[int]:
+    def probhail_trend(self) -> np.ndarray:
         """
         Trend of probability of severe hail [%] values for this track
 
         Returns:
-            List[int]: Trend of probability of severe hail [%] values for this track
+            np.ndarray: Trend of probability of severe hail [%] values for this track
         """
-        return [e.probhail for e in self._feature_list]
+        return self._get_arr()['probhail']
 
     @property
-    @cache
-    def probwind_trend(self) -> List[int]:
+    def probwind_trend(self) -> np.ndarray:
         """
         Trend of probability of severe wind [%] values for this track
 
         Returns:
-            List[int]: Trend of probability of severe wind [%] values for this track
+            np.ndarray: Trend of probability of severe wind [%] values for this track
         """
-        return [e.probwind for e in self._feature_list]
+        return self._get_arr()['probwind']
 
-    @property
-    @cache
     def property_trend(self, key: str) -> List[float]:
         """
         Fetch the trend for a miscellaneous property.
+        Computed on first call for each key, then persisted.
 
         Args:
             key (str): Property key
@@ -171,10 +204,13 @@ class ProbSevereFeatureTrack:
         Returns:
             List[float]: Property trend
         """
-        return [float(e.get_property(key)) for e in self._feature_list]
+        trend = self._prop_cache.get(key)
+        if trend is None:
+            trend = [float(e.get_property(key)) for e in self._feature_list]
+            self._prop_cache[key] = trend
+        return trend
 
-    @property
-    @cache
+    @cached_property
     def linestring(self) -> ogr.Geometry:
         """
         OGR LineString Geometry for this track
@@ -182,10 +218,12 @@ class ProbSevereFeatureTrack:
         Returns:
             ogr.Geometry: OGR LineString Geometry for this track
         """
-        line = ogr.Geometry(ogr.wkbLineString)
-        for pt_x, pt_y in self.centroids:
-            line.AddPoint_2D(pt_x, pt_y)
-        return line
+        # Build in one OGR call from little-endian WKB (byte order, type,
+        # point count, then packed x/y doubles), rather than adding points
+        # one at a time
+        pts = np.ascontiguousarray(self.centroids, dtype='<f8')
+        wkb = struct.pack('<BII', 1, ogr.wkbLineString, len(pts))
+        return ogr.CreateGeometryFromWkb(wkb + pts.tobytes())
 
     @property
     def wkt_str(self) -> str:
@@ -195,4 +233,4 @@ class ProbSevereFeatureTrack:
         Returns:
             str: LineString WKT string for this track
         """
-        return self.linestring.ExportToWkt()
\ No newline at end of file
+        return self.linestring.ExportToWkt()
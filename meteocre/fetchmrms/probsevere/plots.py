@@ -3,8 +3,6 @@
 """ ProbSevere plotting convenience functions """
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.dates as dates
 
 from .feature_track import ProbSevereFeatureTrack
 
@@ -16,37 +14,54 @@ def panel_plot_for_track(track: ProbSevereFeatureTrack):
     Args:
         track (ProbSevereFeatureTrack): Input track
     """
+    # Imported here so that importing this module doesn't load matplotlib
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as dates
+
+    # The panels share an x axis, so they can share one set of tick
+    # locators / formatter. These are bound to an axis when set, so they
+    # are created per figure rather than at module level.
+    minor_locator = dates.MinuteLocator(interval=2)
+    major_locator = dates.MinuteLocator(interval=10)
+    major_formatter = dates.DateFormatter('%H:%M')
 
     def set_locator(_ax):
-        _ax.xaxis.set_minor_locator(dates.MinuteLocator(interval=2))
-        _ax.xaxis.set_major_locator(dates.MinuteLocator(interval=10))
-        _ax.xaxis.set_major_formatter(dates.DateFormatter('%H:%M'))
+        _ax.xaxis.set_minor_locator(minor_locator)
+        _ax.xaxis.set_major_locator(major_locator)
+        _ax.xaxis.set_major_formatter(major_formatter)
 
     ax: np.ndarray
     fig, ax = plt.subplots(2, 2, sharex=True, sharey=False)     # type: ignore
 
     fig.suptitle('Track ID: %d' % track.feat_id)
 
+    # Convert times to matplotlib date numbers once for all panels
+    t = dates.date2num(track.valid_times)
+
     set_locator(ax[0][0])
-    ax[0][0].plot(track.valid_times, track.probsevere_trend)
+    ax[0][0].xaxis_date()
+    ax[0][0].plot(t, track.probsevere_trend)
     ax[0][0].set_xlabel('Time (UTC)')
     ax[0][0].set_ylabel('ProbSevere [%]')
     ax[0][0].grid()
 
     set_locator(ax[0][1])
-    ax[0][1].plot(track.valid_times, track.probtor_trend)
+    ax[0][1].xaxis_date()
+    ax[0][1].plot(t, track.probtor_trend)
     ax[0][1].set_xlabel('Time (UTC)')
     ax[0][1].set_ylabel('ProbTor [%]')
     ax[0][1].grid()
 
     set_locator(ax[1][0])
-    ax[1][0].plot(track.valid_times, track.probhail_trend)
+    ax[1][0].xaxis_date()
+    ax[1][0].plot(t, track.probhail_trend)
     ax[1][0].set_xlabel('Time (UTC)')
     ax[1][0].set_ylabel('ProbHail [%]')
     ax[1][0].grid()
 
     set_locator(ax[1][1])
-    ax[1][1].plot(track.valid_times, track.probwind_trend)
+    ax[1][1].xaxis_date()
+    ax[1][1].plot(t, track.probwind_trend)
     ax[1][1].set_xlabel('Time (UTC)')
     ax[1][1].set_ylabel('ProbWind [%]')
     ax[1][1].grid()
\ No newline at end of file
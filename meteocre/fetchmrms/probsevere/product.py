@@ -14,10 +14,9 @@ from __future__ import annotations
 import json
 
 import pathlib
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Union, Optional, List
 
-import pytz
 from osgeo import gdal, ogr
 
 from . import get_logger
@@ -72,7 +71,7 @@ class ProbSevereProduct:
         try:
             self._valid_time = datetime.strptime(
                 valid_time_str, '%Y%m%d_%H%M%S UTC').replace(
-                    tzinfo=pytz.UTC)     # type: datetime
+                    tzinfo=timezone.utc)     # type: datetime
         except ValueError as e:
             raise ValueError('Could not parse dataset valid time str: %s.' %
                              str(e))
@@ -4,14 +4,11 @@
 
 from __future__ import annotations
 
-import io
 import abc
 import csv
-from typing import Any, List, TypeVar
+from typing import Any, Dict, List, TypeVar
 import requests
-from datetime import datetime
-
-import pytz
+from datetime import datetime, timezone
 
 
 class SPCReport(abc.ABC):
@@ -22,14 +19,12 @@ class SPCReport(abc.ABC):
 
     def __init__(self, date, time, location, county, state, lat, lon,
                  comments):
-        self.time = date.replace(hour=int(time[0:2]),
-                                 minute=int(time[2:4])).astimezone(pytz.UTC)
-        self.location = location
-        self.county = county
-        self.state = state
-        self.lat = float(lat)
-        self.lon = float(lon)
-        self.comments = comments
+        # Localize the report's wall-clock time on the report day, so the UTC
+        # offset is the one in effect at that time (not at midnight)
+        t = date.replace(hour=int(time[0:2]), minute=int(time[2:4]))
+        (self.time, self.location, self.county, self.state, self.lat, self.lon,
+         self.comments) = (t.astimezone(timezone.utc), location, county, state,
+                           float(lat), float(lon), comments)
 
     def __str__(self):
         return '(%s: Time: %s, Lat: %.3f, Lon: %.3f)' % (
@@ -94,6 +89,25 @@ class SPCReportFactory():
         'Time', 'Size', 'Location', 'County', 'State', 'Lat', 'Lon', 'Comments'
     ]
 
+    @classmethod
+    def report_class_for_header(cls, header: List[str]) -> type:
+        """
+        Return the SPC report class for a CSV header
+
+        Args:
+            header (List[str]): CSV header
+
+        Raises:
+            ValueError: If the CSV header is unrecognized.
+
+        Returns:
+            type: SPC report class for the CSV header
+        """
+        report_cls = _HEADER_CLASSES.get(tuple(header))
+        if report_cls is None:
+            raise ValueError('Unrecognized header: %s' % repr(header))
+        return report_cls
+
     @classmethod
     def from_csv_line(cls, date: datetime, header: List[str],
                       line: List[str]) -> SPCReport:
@@ -106,29 +120,46 @@ class SPCReportFactory():
             line (List[str]): CSV line data
 
         Raises:
-            ValueError: If the CSV header is unrecognized.
+            ValueError: If the CSV header is unrecognized, or the line does not match it.
 
         Returns:
             SPCReport: SPC report fo CSV line
         """
-        assert len(header) == len(line)
-        if header == cls.TORNADO_HEADER:
-            return SPCTornadoReport(date, *line)
-        elif header == cls.WIND_HEADER:
-            return SPCWindReport(date, *line)
-        elif header == cls.HAIL_HEADER:
-            return SPCHailReport(date, *line)
-        else:
-            raise ValueError('Unrecognized header: %s' % repr(header))
+        if len(header) != len(line):
+            raise ValueError('Expected %d fields in CSV line, got %d: %s' %
+                             (len(header), len(line), repr(line)))
+        return cls.report_class_for_header(header)(date, *line)
+
+
+# CSV header -> SPC report class
+_HEADER_CLASSES = {
+    tuple(SPCReportFactory.TORNADO_HEADER): SPCTornadoReport,
+    tuple(SPCReportFactory.WIND_HEADER): SPCWindReport,
+    tuple(SPCReportFactory.HAIL_HEADER): SPCHailReport
+}
 
 
 class SPCReportsProduct():
     """ Class to hold a collection of SPC reports """
 
-    __slots__ = ['_reports']
+    __slots__ = ['_reports', '_by_type']
 
-    def __init__(self, reports: List[SPCReportType]):
-        self.reports = reports
+    # Shared HTTP session, so fetching a range of dates re-uses connections
+    _session = requests.Session()
+
+    def __init__(self, reports: List[SPCReportType], validate: bool = True):
+        """
+        Instantiate a collection of SPC reports
+
+        Args:
+            reports (List[SPCReportType]): List of reports
+            validate (bool, optional): Whether or not to filter the reports to
+                SPCReport instances. Defaults to True.
+        """
+        if validate:
+            self.reports = reports
+        else:
+            self._set_reports(reports)
 
     @property
     def reports(self) -> List[Any]:
@@ -150,7 +181,27 @@ class SPCReportsProduct():
                 SPCReport before entering class.
         """
         # Sanity check that all inputs are storm reports
-        self._reports = [e for e in v if issubclass(e.__class__, SPCReport)]
+        self._set_reports([e for e in v if isinstance(e, SPCReport)])
+
+    def _set_reports(self, v: List[Any]):
+        """
+        Set the reports of this collection, without filtering them
+
+        Args:
+            v (List[Any]): List of SPC reports
+        """
+        self._reports = v
+
+        # Bucket reports by type in a single pass
+        self._by_type = {
+            SPCTornadoReport: [],
+            SPCWindReport: [],
+            SPCHailReport: []
+        }     # type: Dict[type, List[Any]]
+        for e in self._reports:
+            bucket = self._by_type.get(type(e))
+            if bucket is not None:
+                bucket.append(e)
 
     @property
     def tornado_reports(self) -> List[SPCTornadoReport]:
@@ -160,7 +211,7 @@ class SPCReportsProduct():
         Returns:
             List[SPCTornadoReport]: List of tornado reports
         """
-        return [e for e in self.reports if e.__class__ == SPCTornadoReport]
+        return self._by_type[SPCTornadoReport]
 
     @property
     def wind_reports(self) -> List[SPCWindReport]:
@@ -170,7 +221,7 @@ class SPCReportsProduct():
         Returns:
             List[SPCWindReport]: List of wind reports
         """
-        return [e for e in self.reports if e.__class__ == SPCWindReport]
+        return self._by_type[SPCWindReport]
 
     @property
     def hail_reports(self) -> List[SPCHailReport]:
@@ -180,21 +231,27 @@ class SPCReportsProduct():
         Returns:
             List[SPCHailReport]: List of hail reports
         """
-        return [e for e in self.reports if e.__class__ == SPCHailReport]
+        return self._by_type[SPCHailReport]
 
     def __len__(self):
         return len(self.reports)
 
     @classmethod
-    def fetch_for_date(cls, fetch_date: datetime) -> SPCReportsProduct:
+    def fetch_for_date(cls,
+                       fetch_date: datetime,
+                       timeout: float = 30.0) -> SPCReportsProduct:
         """
         Fetch the SPC reports for a given date.
 
         Args:
             fetch_date (datetime): Fetch date.
+            timeout (float, optional): Request timeout [s]. Defaults to 30.0.
 
         Raises:
-            RuntimeError: If the downloaded CSV header was not valid.
+            requests.HTTPError: If the CSV could not be downloaded.
+            RuntimeError: If no CSV header was detected before a report.
+            ValueError: If the downloaded CSV header was not recognized, or
+                a report line does not match it.
 
         Returns:
             SPCReportsProduct: Collection of SPC reports for the date
@@ -204,33 +261,44 @@ class SPCReportsProduct():
         # Build fetch URL for the date
         url = cls.build_url_for_date(fetch_date)
 
-        # Load the data, and save it to a temp BytesIO object
-        with io.BytesIO() as temp_bytes:
-
-            # Download the CSV file
-            with requests.get(url) as r:
-                temp_bytes.write(r.content)
-            temp_bytes.seek(0)
-
-            # Read the CSV file
-            with io.TextIOWrapper(temp_bytes) as f:
-                reader = csv.reader(f)
-                header = None
-                for line in reader:
-                    # Line's that start with 'Time' are headers, otherwise it's a report
-                    if line[0] == 'Time':
-                        header = line
-                    else:
-                        # Sanity check that a header has occurred by now
-                        if header is None:
-                            raise RuntimeError('CSV header was not detected!')
-                        # Generate the corresponding report and append it to the list
-                        report = SPCReportFactory.from_csv_line(
-                            fetch_date, header, line)
-                        reports.append(report)
-
-        # Return the instantiated class with the reports
-        return cls(reports)
+        # Report day, in the caller's timezone. Each report sets its own
+        # wall-clock time on it before converting to UTC.
+        report_date = fetch_date.replace(hour=0,
+                                         minute=0,
+                                         second=0,
+                                         microsecond=0)
+
+        # Download the CSV file. These are small (tens of KB), so decode it
+        # in one go rather than line by line.
+        with cls._session.get(url, timeout=timeout) as r:
+            r.raise_for_status()
+            text = r.content.decode('utf-8', errors='replace')
+
+        # Read the CSV file
+        report_cls, n_fields = None, 0
+        for line in csv.reader(text.splitlines()):
+            # Skip blank lines
+            if not line:
+                continue
+            # Line's that start with 'Time' are headers, otherwise it's a report
+            if line[0] == 'Time':
+                # Look up the report class once per header
+                report_cls = SPCReportFactory.report_class_for_header(line)
+                n_fields = len(line)
+            else:
+                # Sanity check that a header has occurred by now
+                if report_cls is None:
+                    raise RuntimeError('CSV header was not detected!')
+                if len(line) != n_fields:
+                    raise ValueError(
+                        'Expected %d fields in CSV line, got %d: %s' %
+                        (n_fields, len(line), repr(line)))
+                # Generate the corresponding report and append it to the list
+                reports.append(report_cls(report_date, *line))
+
+        # Return the instantiated class with the reports. These all came
+        # from the report factory, so there is no need to filter them.
+        return cls(reports, validate=False)
 
     @staticmethod
     def build_url_for_date(d: datetime) -> str:
@@ -243,5 +311,5 @@ class SPCReportsProduct():
         Returns:
             str: URL to report CSV
         """
-        return 'https://www.spc.noaa.gov/climo/reports/%s_rpts_filtered.csv' % d.strftime(
-            r'%y%m%d')
+        return 'https://www.spc.noaa.gov/climo/reports/%02d%02d%02d_rpts_filtered.csv' % (
+            d.year % 100, d.month, d.day)
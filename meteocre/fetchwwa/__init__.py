@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import pathlib
+import importlib
 
 from .. import get_logger as _get_logger
 from .. import get_download_dir as _get_download_dir
@@ -17,4 +18,24 @@ def get_download_dir():
     return d
 
 
-from .wwa_polygon import WWAPolygon
\ No newline at end of file
+# Public classes / functions, imported from their submodules on first access
+_LAZY_ATTRS = {
+    'WWAPolygon': '.wwa_polygon',
+}
+
+# Listed explicitly so that star-imports also export the lazy names
+__all__ = ['get_logger', 'get_download_dir', *_LAZY_ATTRS]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -8,11 +8,10 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from osgeo import ogr
-import pytz
 
 from .phenom import VTEC_PHENOMENA, VTEC_SIGNIFICANCE
 
@@ -149,17 +148,30 @@ class WWAPolygon:
     @staticmethod
     def _parse_dt_str(dt_str: str) -> datetime:
         """
-        Parse datetime string from input GeoJSON into
+        Parse datetime string (YYYYmmddHHMM, UTC) from input GeoJSON into
         timezone-aware datetime.
 
         Args:
             dt_str (str): Input datetime string
 
+        Raises:
+            ValueError: If the string is not in YYYYmmddHHMM format.
+
         Returns:
             datetime: Output timezone-aware datetime
         """
-        return datetime.strptime(dt_str,
-                                 r'%Y%m%d%H%M').replace(tzinfo=pytz.UTC)
+        # Fixed-width format, so compute each field from the digit bytes
+        # directly rather than going through strptime (or str slices).
+        # Subtracting 53328 / 528 removes the '0' (48) offset of each digit.
+        b = dt_str.encode('ascii')
+        if len(b) != 12 or not b.isdigit():
+            raise ValueError('Invalid datetime string: %s' % repr(dt_str))
+        year = b[0] * 1000 + b[1] * 100 + b[2] * 10 + b[3] - 53328
+        month = b[4] * 10 + b[5] - 528
+        day = b[6] * 10 + b[7] - 528
+        hour = b[8] * 10 + b[9] - 528
+        minute = b[10] * 10 + b[11] - 528
+        return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
 
     @classmethod
     def from_ogr_feature(cls, feat: ogr.Feature) -> WWAPolygon:
@@ -172,8 +184,8 @@ class WWAPolygon:
         Returns:
              WWAPolygon: Generated object
         """
-        return cls.from_json(json.loads(
-            feat.ExportToJson()))     # type: ignore
+        return cls._from_props_and_geom(feat.items(),
+                                        feat.GetGeometryRef().Clone())
 
     @classmethod
     def from_json(cls, json_dict: Dict[str, Any]) -> WWAPolygon:
@@ -186,59 +198,51 @@ class WWAPolygon:
         Returns:
              WWAPolygon: Generated object
         """
-        props: Dict[str, Any] = json_dict['properties']
-
-        wfo = props['WFO']
-        issued_time = cls._parse_dt_str(props['ISSUED'])
-        expired_time = cls._parse_dt_str(props['EXPIRED'])
-        init_issued_time = cls._parse_dt_str(props['INIT_ISS'])
-        init_expired_time = cls._parse_dt_str(props['INIT_EXP'])
-        phenom = props['PHENOM']
-        significance = props['SIG']
-        geotype = props['GTYPE']
-        event_id = int(props['ETN'])
-        status = props['STATUS']
-        nws_ugc = props['NWS_UGC']
-        area = float(props['AREA_KM2'])
-        updated = cls._parse_dt_str(props['UPDATED'])
-        hv_nwsli = props['HV_NWSLI']
-        hv_sev = props['HV_SEV']
-        hv_cause = props['HV_CAUSE']
-        hv_rec = props['HV_REC']
-        is_emergency = bool(props['EMERGENC'])
-        poly_begin_time = cls._parse_dt_str(
-            props['POLY_BEG']) if props['POLY_BEG'] is not None else None
-        poly_end_time = cls._parse_dt_str(
-            props['POLY_END']) if props['POLY_END'] is not None else None
-        hail_tag = props['HAILTAG']
-        tornado_tag = props['TORNTAG']
-        wind_tag = props['WINDTAG']
-        damage_tag = props['DAMAGTAG']
-        ogr_poly = ogr.CreateGeometryFromJson(str(json_dict['geometry']))
-        assert ogr_poly.GetGeometryType() == ogr.wkbPolygon
-
-        return cls(wfo=wfo,
-                   issued_time=issued_time,
-                   expired_time=expired_time,
-                   init_issued_time=init_issued_time,
-                   init_expired_time=init_expired_time,
-                   phenom=phenom,
-                   significance=significance,
-                   geotype=geotype,
-                   event_id=event_id,
-                   status=status,
-                   nws_ugc=nws_ugc,
-                   area=area,
-                   updated=updated,
-                   hv_nwsli=hv_nwsli,
-                   hv_sev=hv_sev,
-                   hv_cause=hv_cause,
-                   hv_rec=hv_rec,
-                   is_emergency=is_emergency,
-                   poly_begin_time=poly_begin_time,
-                   poly_end_time=poly_end_time,
-                   hail_tag=hail_tag,
-                   tornado_tag=tornado_tag,
-                   wind_tag=wind_tag,
-                   damage_tag=damage_tag,
+        return cls._from_props_and_geom(
+            json_dict['properties'],
+            ogr.CreateGeometryFromJson(json.dumps(json_dict['geometry'])))
+
+    @classmethod
+    def _from_props_and_geom(cls, props: Dict[str, Any],
+                             ogr_poly: ogr.Geometry) -> WWAPolygon:
+        """
+        Create a WWAPolygon from a property dict and OGR geometry
+
+        Args:
+            props (Dict[str, Any]): WWA feature properties
+            ogr_poly (ogr.Geometry): OGR Polygon geometry
+
+        Returns:
+             WWAPolygon: Generated object
+        """
+        parse_dt_str = cls._parse_dt_str
+        poly_begin = props['POLY_BEG']
+        poly_end = props['POLY_END']
+        return cls(wfo=props['WFO'],
+                   issued_time=parse_dt_str(props['ISSUED']),
+                   expired_time=parse_dt_str(props['EXPIRED']),
+                   init_issued_time=parse_dt_str(props['INIT_ISS']),
+                   init_expired_time=parse_dt_str(props['INIT_EXP']),
+                   phenom=props['PHENOM'],
+                   significance=props['SIG'],
+                   geotype=props['GTYPE'],
+                   event_id=int(props['ETN']),
+                   status=props['STATUS'],
+                   nws_ugc=props['NWS_UGC'],
+                   area=float(props['AREA_KM2']),
+                   updated=parse_dt_str(props['UPDATED']),
+                   hv_nwsli=props['HV_NWSLI'],
+                   hv_sev=props['HV_SEV'],
+                   hv_cause=props['HV_CAUSE'],
+                   hv_rec=props['HV_REC'],
+                   is_emergency=bool(props['EMERGENC']),
+                   poly_begin_time=parse_dt_str(poly_begin)
+                   if poly_begin is not None else None,
+                   poly_end_time=parse_dt_str(poly_end)
+                   if poly_end is not None else None,
+                   hail_tag=props['HAILTAG'],
+                   tornado_tag=props['TORNTAG'],
+                   wind_tag=props['WINDTAG'],
+                   damage_tag=props['DAMAGTAG'],
                    ogr_poly=ogr_poly)
+
@@ -1,4 +1,5 @@
 import pathlib
+import importlib
 
 from .. import get_logger as _get_logger
 from .. import get_download_dir as _get_download_dir
@@ -14,7 +15,27 @@ def get_download_dir():
     return d
 
 
-from .storm_event_detailed_report import StormEventDetailedReport
-from .storm_event_fatality_report import StormEventFatalityReport
-from .storm_event_location import StormEventLocation
-from .fetch import fetch_from_storm_events_archive
\ No newline at end of file
+# Public classes / functions, imported from their submodules on first access
+_LAZY_ATTRS = {
+    'StormEventDetailedReport': '.storm_event_detailed_report',
+    'StormEventFatalityReport': '.storm_event_fatality_report',
+    'StormEventLocation': '.storm_event_location',
+    'fetch_from_storm_events_archive': '.fetch',
+}
+
+# Listed explicitly so that star-imports also export the lazy names
+__all__ = ['get_logger', 'get_download_dir', *_LAZY_ATTRS]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
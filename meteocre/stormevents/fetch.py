@@ -1,17 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import gzip
-import shutil
+import re
+import pickle
 import pathlib
-from io import BytesIO
 from ftplib import FTP
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union, Sequence
 
 from . import get_logger, get_download_dir
+from .utils import ftp_download_and_extract_gzip
 
 from . import StormEventDetailedReport, StormEventFatalityReport, StormEventLocation
 
+# NCEI storm events archive
+_FTP_HOST = 'ftp.ncei.noaa.gov'
+_FTP_DIR = '/pub/data/swdi/stormevents/csvfiles/'
+
+# Version of the pickled product lists written beside each CSV. Bump this
+# whenever the report classes change so that stale caches are re-parsed.
+_PICKLE_CACHE_VERSION = 3
+
 
 def _get_filename_for_product_type(year: int, product_type: str) -> str:
     """
@@ -27,22 +37,83 @@ def _get_filename_for_product_type(year: int, product_type: str) -> str:
     return 'stormevents_%s_%d.csv' % (product_type, year)
 
 
-def _ftp_download_and_extract_gzip(
-        ftp: FTP, ftp_name: str, output_path: Union[str,
-                                                    pathlib.Path]) -> None:
+def _ftp_fetch_one(ftp_name: str, output_path: Union[str,
+                                                     pathlib.Path]) -> None:
     """
-    Simultaneously download and unzip a Gzip archive from an FTP target
+    Download and unzip a single file from the NCEI storm events archive,
+    on its own FTP connection (so that several can run concurrently)
 
     Args:
-        ftp (FTP): FTP object
         ftp_name (str): Filename to retrieve
         output_path (Union[str, pathlib.Path]): Output path
     """
-    fio = BytesIO()
-    ftp.retrbinary('RETR %s' % ftp_name, fio.write)
-    fio.seek(0)
-    with open(output_path, 'wb') as fout, gzip.GzipFile(fileobj=fio) as gz:
-        shutil.copyfileobj(gz, fout)
+    with FTP(_FTP_HOST) as ftp:
+        ftp.login()
+        ftp.cwd(_FTP_DIR)
+        ftp_download_and_extract_gzip(ftp, ftp_name, output_path)
+
+
+@lru_cache(maxsize=1)
+def _list_storm_events_files() -> tuple[str, ...]:
+    """
+    List the files in the NCEI storm events archive. The listing is cached,
+    so that fetching several years only lists the archive once.
+
+    Returns:
+        tuple[str, ...]: Filenames in the archive
+    """
+    with FTP(_FTP_HOST) as ftp:
+        ftp.login()
+        ftp.cwd(_FTP_DIR)
+        return tuple(ftp.nlst())
+
+
+def _load_product(product: str, product_path: pathlib.Path) -> list:
+    """
+    Load a downloaded product's CSV file into report objects. The parsed
+    list is pickled beside the CSV, and reused as long as it is newer than
+    the CSV file.
+
+    Args:
+        product (str): Product type to load
+        product_path (pathlib.Path): Path to the product's CSV file
+
+    Returns:
+        list: Report objects for the product
+    """
+    logger = get_logger()
+
+    cache_path = product_path.with_suffix('.pkl')
+    if (cache_path.exists() and
+            cache_path.stat().st_mtime_ns >= product_path.stat().st_mtime_ns):
+        try:
+            with open(cache_path, 'rb') as f:
+                version, obj_lst = pickle.load(f)
+            if version == _PICKLE_CACHE_VERSION:
+                return obj_lst
+        except Exception as e:
+            logger.warning('Failed to load cached %s products: %s' %
+                           (product, str(e)))
+
+    if product == 'details':
+        obj_lst = StormEventDetailedReport.from_csv(product_path)
+    elif product == 'fatalities':
+        obj_lst = StormEventFatalityReport.from_csv(product_path)
+    elif product == 'locations':
+        obj_lst = StormEventLocation.from_csv(product_path)
+    else:
+        logger.warning('Seeing unknown product: %s' % product)
+        return []
+
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump((_PICKLE_CACHE_VERSION, obj_lst),
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning('Failed to cache %s products: %s' % (product, str(e)))
+
+    return obj_lst
 
 
 def fetch_from_storm_events_archive(
@@ -60,9 +131,7 @@ def fetch_from_storm_events_archive(
 
     Raises:
         ValueError: If the product type is invalid.
-        ValueError: If no matches are found for event details.
-        ValueError: If no matches are found for event fatalities.
-        ValueError: If no matches are found for event locations.
+        ValueError: If no matches are found for a product to fetch.
 
     Returns:
         Optional[dict[str, list]]: If load is True, loaded products. Else None.
@@ -103,69 +172,42 @@ def fetch_from_storm_events_archive(
         else:
             products_to_fetch.append(product)
 
-    # FTP to NCEI storm events archive
-    with FTP('ftp.ncei.noaa.gov') as ftp:
-        ftp.login()
-        ftp.cwd('/pub/data/swdi/stormevents/csvfiles/')
-        file_list = ftp.nlst()
-
-        # Get 'details' products
-        if 'details' in products_to_fetch:
-            details_match = [
-                e for e in file_list
-                if ('d%d' % query_year in e and 'details' in e)
-            ]
-            if not len(details_match):
-                raise ValueError('Found no matches for event details!')
-            if len(details_match) > 1:
-                logger.warning(
-                    'Multiple matches found for details! Taking first.')
-            details_match = details_match[0]
-
-            logger.info('Downloading and unzipping details file...')
-            details_csv_path = pathlib.Path(
-                download_dir,
-                _get_filename_for_product_type(query_year, 'details'))
-            _ftp_download_and_extract_gzip(ftp, details_match,
-                                           details_csv_path)
-
-        if 'fatalities' in products_to_fetch:
-            fatalities_match = [
-                e for e in file_list
-                if ('d%d' % query_year in e and 'fatalities' in e)
-            ]
-            if not len(fatalities_match):
-                raise ValueError('Found no matches for event fatalities!')
-            if len(fatalities_match) > 1:
-                logger.warning(
-                    'Multiple matches found for fatalities! Taking first.')
-            fatalities_match = fatalities_match[0]
-
-            logger.info('Downloading and unzipping fatalities file...')
-            fatalities_csv_path = pathlib.Path(
-                download_dir,
-                _get_filename_for_product_type(query_year, 'fatalities'))
-            _ftp_download_and_extract_gzip(ftp, fatalities_match,
-                                           fatalities_csv_path)
-
-        if 'locations' in products_to_fetch:
-            locations_match = [
-                e for e in file_list
-                if ('d%d' % query_year in e and 'locations' in e)
-            ]
-            if not len(locations_match):
-                raise ValueError('Found no matches for event locations!')
-            if len(locations_match) > 1:
-                logger.warning(
-                    'Multiple matches found for locations! Taking first.')
-            locations_match = locations_match[0]
-
-            logger.info('Downloading and unzipping locations file...')
-            locations_csv_path = pathlib.Path(
-                download_dir,
-                _get_filename_for_product_type(query_year, 'locations'))
-            _ftp_download_and_extract_gzip(ftp, locations_match,
-                                           locations_csv_path)
+    if len(products_to_fetch):
+        # List the NCEI storm events archive
+        file_list = _list_storm_events_files()
+
+        # Match a file to each product to fetch, in a single pass over the
+        # listing (ex. StormEvents_details-ftp_v1.0_d2022_c20230317.csv.gz)
+        file_pat = re.compile(
+            r'(%s)-.*_d%d_c\d+\.csv\.gz$' %
+            ('|'.join(map(re.escape, products_to_fetch)), query_year))
+        product_matches = {}     # type: dict[str, list[str]]
+        for e in file_list:
+            m = file_pat.search(e)
+            if m is not None:
+                product_matches.setdefault(m.group(1), []).append(e)
+
+        ftp_names = []
+        for product in products_to_fetch:
+            product_match = product_matches.get(product)
+            if not product_match:
+                raise ValueError('Found no matches for event %s!' % product)
+            if len(product_match) > 1:
+                logger.warning('Multiple matches found for %s! Taking first.' %
+                               product)
+            ftp_names.append(product_match[0])
+
+        # Download the products concurrently, one FTP connection each
+        logger.info('Downloading and unzipping %s files...' %
+                    ', '.join(products_to_fetch))
+        output_paths = [
+            pathlib.Path(download_dir,
+                         _get_filename_for_product_type(query_year, product))
+            for product in products_to_fetch
+        ]
+        with ThreadPoolExecutor(max_workers=len(ftp_names)) as executor:
+            # Consume the results so that any download errors are raised
+            list(executor.map(_ftp_fetch_one, ftp_names, output_paths))
 
     # Load requested products
     if load:
@@ -173,16 +215,7 @@ def fetch_from_storm_events_archive(
         for product, product_path in zip(products_to_load, product_paths):
             logger.info('Loading %s products for query year %d...' %
                         (product, query_year))
-            if product == 'details':
-                obj_lst = StormEventDetailedReport.from_csv(product_path)
-            elif product == 'fatalities':
-                obj_lst = StormEventFatalityReport.from_csv(product_path)
-            elif product == 'locations':
-                obj_lst = StormEventLocation.from_csv(product_path)
-            else:
-                logger.warning('Seeing unknown product: %s' % product)
-                obj_lst = []
-            loaded_products[product] = obj_lst
+            loaded_products[product] = _load_product(product, product_path)
 
         # Return loaded products
         return loaded_products
@@ -3,17 +3,89 @@
 from __future__ import annotations
 
 import csv
+import sys
 import pathlib
-from typing import Union, Optional, List
+from typing import Any, Union, Optional, List
 from datetime import datetime, timedelta
+from operator import itemgetter
 from dataclasses import dataclass
 
-from .utils import to_datetime
+from .utils import to_datetime_list, read_csv_table
+
+# CSV columns read for each detailed report, in order
+_CSV_COLUMNS = ('EVENT_ID', 'EPISODE_ID', 'BEGIN_YEARMONTH', 'BEGIN_DAY',
+                'BEGIN_TIME', 'END_YEARMONTH', 'END_DAY', 'END_TIME',
+                'CZ_TIMEZONE', 'STATE', 'STATE_FIPS', 'EVENT_TYPE', 'CZ_TYPE',
+                'CZ_FIPS', 'CZ_NAME', 'WFO', 'INJURIES_DIRECT',
+                'INJURIES_INDIRECT', 'DEATHS_DIRECT', 'DEATHS_INDIRECT',
+                'DAMAGE_PROPERTY', 'DAMAGE_CROPS', 'SOURCE', 'MAGNITUDE',
+                'MAGNITUDE_TYPE', 'FLOOD_CAUSE', 'TOR_F_SCALE', 'TOR_LENGTH',
+                'TOR_WIDTH', 'TOR_OTHER_WFO', 'TOR_OTHER_CZ_STATE',
+                'TOR_OTHER_CZ_FIPS', 'TOR_OTHER_CZ_NAME', 'BEGIN_RANGE',
+                'BEGIN_AZIMUTH', 'BEGIN_LOCATION', 'BEGIN_LAT', 'BEGIN_LON',
+                'END_RANGE', 'END_AZIMUTH', 'END_LOCATION', 'END_LAT',
+                'END_LON', 'EPISODE_NARRATIVE', 'EVENT_NARRATIVE')
+
+# Begin / end time fields of a row from _CSV_COLUMNS
+_get_time_fields = itemgetter(2, 3, 4, 5, 6, 7, 8)
+
+# PyArrow column types for detailed reports (see table_from_csv)
+_ARROW_COLUMN_TYPES = {
+    'EVENT_ID': 'int64',
+    'EPISODE_ID': 'int64',
+    'STATE_FIPS': 'int32',
+    'CZ_FIPS': 'int32',
+    'TOR_F_SCALE': 'string',
+    'TOR_LENGTH': 'float64',
+    'TOR_WIDTH': 'float64',
+    'BEGIN_LAT': 'float64',
+    'BEGIN_LON': 'float64',
+    'END_LAT': 'float64',
+    'END_LON': 'float64',
+}
+
+
+def _read_csv_rows(csv_file: Union[str, pathlib.Path],
+                   tornado_only: bool = False) -> List[tuple]:
+    """
+    Read the fields of each detailed report from a CSV file
+
+    Args:
+        csv_file (Union[str, pathlib.Path]): CSV file to read in
+        tornado_only (bool, optional): Whether or not to only keep rows for
+            tornado events. Defaults to False.
+
+    Returns:
+        List[tuple]: Fields for each row, ordered as _CSV_COLUMNS
+    """
+    with open(csv_file, 'r') as f:
+        reader = csv.reader(f)
+
+        # Look up the columns we need once, from the header
+        col_idx = {k: i for i, k in enumerate(next(reader))}
+        get_fields = itemgetter(*(col_idx[k] for k in _CSV_COLUMNS))
+
+        if tornado_only:
+            # Check the raw F-scale column, before picking out any fields
+            tor_idx = col_idx['TOR_F_SCALE']
+            return [get_fields(row) for row in reader if row[tor_idx]]
+        return list(map(get_fields, reader))
 
 
 @dataclass
 class StormEventDetailedReport:
     """ Class to store a detailed event report from the NOAA NCEI Storm Events Database """
+    __slots__ = ('event_id', 'episode_id', 'start_time', 'end_time', 'state',
+                 'state_fips', 'event_type', 'cz_type', 'cz_fips', 'cz_name',
+                 'wfo', 'injuries_direct', 'injuries_indirect',
+                 'deaths_direct', 'deaths_indirect', 'damage_property',
+                 'damage_crops', 'source', 'magnitude', 'magnitude_type',
+                 'flood_cause', 'tor_f_scale', 'tor_length', 'tor_width',
+                 'tor_other_wfo', 'tor_other_cz_state', 'tor_other_cz_fips',
+                 'tor_other_cz_name', 'begin_range', 'begin_azimuth',
+                 'begin_location_name', 'begin_lat', 'begin_lon', 'end_range',
+                 'end_azimuth', 'end_location_name', 'end_lat', 'end_lon',
+                 'episode_narrative', 'event_narrative')
     event_id: int
     episode_id: int
     start_time: datetime
@@ -21,20 +93,57 @@ class StormEventDetailedReport:
     state: str
     state_fips: int
     event_type: str
-    cz: dict
+    cz_type: str
+    cz_fips: int
+    cz_name: str
     wfo: str
-    injuries: dict
-    deaths: dict
-    damage: dict
+    injuries_direct: int
+    injuries_indirect: int
+    deaths_direct: int
+    deaths_indirect: int
+    damage_property: str
+    damage_crops: str
     source: str
-    magnitude: Union[None, dict]
+    magnitude: Optional[str]     # None if no magnitude is given
+    magnitude_type: Optional[str]
     flood_cause: str
-    tornado: Union[None, dict]
-    begin_location: Optional[dict]
-    end_location: Optional[dict]
+    tor_f_scale: Optional[str]     # tor_* are None if not a tornado event
+    tor_length: Optional[float]
+    tor_width: Optional[float]
+    tor_other_wfo: Optional[str]
+    tor_other_cz_state: Optional[str]     # None if it didn't leave the CZ
+    tor_other_cz_fips: Optional[str]
+    tor_other_cz_name: Optional[str]
+    begin_range: Optional[int]     # begin_* are None if not given
+    begin_azimuth: Optional[str]
+    begin_location_name: Optional[str]
+    begin_lat: Optional[float]
+    begin_lon: Optional[float]
+    end_range: Optional[int]     # end_* are None if not given
+    end_azimuth: Optional[str]
+    end_location_name: Optional[str]
+    end_lat: Optional[float]
+    end_lon: Optional[float]
     episode_narrative: str
     event_narrative: str
 
+    @staticmethod
+    def table_from_csv(csv_file: Union[str, pathlib.Path]) -> Any:
+        """
+        Load detailed reports from a CSV file as a PyArrow table, without
+        creating an object per report. Requires the optional pyarrow dependency.
+
+        Useful to filter before creating objects, ex. tornado events only:
+        table.filter(pyarrow.compute.not_equal(table['TOR_F_SCALE'], ''))
+
+        Args:
+            csv_file (Union[str, pathlib.Path]): CSV file to read in
+
+        Returns:
+            pyarrow.Table: Table of storm event reports from the CSV file
+        """
+        return read_csv_table(csv_file, _ARROW_COLUMN_TYPES)
+
     @classmethod
     def from_csv(
             cls,
@@ -49,84 +158,108 @@ class StormEventDetailedReport:
         Returns:
             List[StormEventDetailedReport]: Storm event report objects from the CSV file
         """
+        return cls._from_rows(_read_csv_rows(csv_file))
+
+    @classmethod
+    def tornado_events_from_csv(
+            cls,
+            csv_file: Union[str,
+                            pathlib.Path]) -> List[StormEventDetailedReport]:
+        """
+        Load only the tornado reports from a CSV file. Equivalent to filtering
+        from_csv() with is_tornado_event, but rows are dropped before any
+        report objects are created.
+
+        Args:
+            csv_file (Union[str, pathlib.Path]): CSV file to read in
+
+        Returns:
+            List[StormEventDetailedReport]: Tornado event report objects from the CSV file
+        """
+        return cls._from_rows(_read_csv_rows(csv_file, tornado_only=True))
+
+    @classmethod
+    def _from_rows(cls, rows: List[tuple]) -> List[StormEventDetailedReport]:
+        """
+        Create report objects from CSV rows
+
+        Args:
+            rows (List[tuple]): Rows of CSV fields, ordered as _CSV_COLUMNS
+
+        Returns:
+            List[StormEventDetailedReport]: Storm event report objects for the rows
+        """
         cls_list = []
-        with open(csv_file, 'r') as f:
-            dict_reader = csv.DictReader(f)
-            for row in dict_reader:
-                this_cls = cls(
-                    event_id=int(row['EVENT_ID']),
-                    episode_id=int(row['EPISODE_ID']),
-                    start_time=to_datetime(row['BEGIN_YEARMONTH'],
-                                           row['BEGIN_DAY'], row['BEGIN_TIME'],
-                                           row['CZ_TIMEZONE']),
-                    end_time=to_datetime(row['END_YEARMONTH'], row['END_DAY'],
-                                         row['END_TIME'], row['CZ_TIMEZONE']),
-                    state=row['STATE'],
-                    state_fips=int(row['STATE_FIPS']),
-                    event_type=row['EVENT_TYPE'],
-                    cz={
-                        'type': row['CZ_TYPE'],
-                        'fips': int(row['CZ_FIPS']),
-                        'name': row['CZ_NAME'],
-                    },
-                    wfo=row['WFO'],
-                    injuries={
-                        'direct': int(row['INJURIES_DIRECT']),
-                        'indirect': int(row['INJURIES_INDIRECT']),
-                    },
-                    deaths={
-                        'direct': int(row['DEATHS_DIRECT']),
-                        'indirect': int(row['DEATHS_INDIRECT']),
-                    },
-                    damage={
-                        'property': row['DAMAGE_PROPERTY'],
-                        'crops': row['DAMAGE_CROPS'],
-                    },
-                    source=row['SOURCE'],
-                    magnitude={
-                        'value': row['MAGNITUDE'],
-                        'type': row['MAGNITUDE_TYPE']
-                    } if len(row['MAGNITUDE']) else None,
-                    flood_cause=row['FLOOD_CAUSE'],
-                    tornado={
-                        'f-scale':
-                        row['TOR_F_SCALE'],
-                        'length':
-                        float(row['TOR_LENGTH'])
-                        if len(row['TOR_LENGTH']) else None,
-                        'width':
-                        float(row['TOR_WIDTH'])
-                        if len(row['TOR_WIDTH']) else None,
-                        'other_wfo':
-                        row['TOR_OTHER_WFO'],
-                        'other_cz': {
-                            'state': row['TOR_OTHER_CZ_STATE'],
-                            'fips': row['TOR_OTHER_CZ_FIPS'],
-                            'name': row['TOR_OTHER_CZ_NAME'],
-                        } if row['TOR_OTHER_CZ_STATE'] else None
-                    } if len(row['TOR_F_SCALE']) else None,
-                    begin_location={
-                        'str':
-                        '%d %s %s' %
-                        (int(row['BEGIN_RANGE']), row['BEGIN_AZIMUTH'],
-                         row['BEGIN_LOCATION']),
-                        'lat':
-                        float(row['BEGIN_LAT']),
-                        'lon':
-                        float(row['BEGIN_LON'])
-                    } if len(row['BEGIN_RANGE']) else None,
-                    end_location={
-                        'str':
-                        '%d %s %s' % (int(row['END_RANGE']),
-                                      row['END_AZIMUTH'], row['END_LOCATION']),
-                        'lat':
-                        float(row['END_LAT']),
-                        'lon':
-                        float(row['END_LON'])
-                    } if len(row['END_RANGE']) else None,
-                    episode_narrative=row['EPISODE_NARRATIVE'],
-                    event_narrative=row['EVENT_NARRATIVE'])
-                cls_list.append(this_cls)
+        if not rows:
+            return cls_list
+
+        # Convert the begin / end time columns in one go
+        time_cols = tuple(zip(*map(_get_time_fields, rows)))
+        start_times = to_datetime_list(*time_cols[0:3], time_cols[6])
+        end_times = to_datetime_list(*time_cols[3:6], time_cols[6])
+
+        # Low-cardinality columns are interned, so that every report shares
+        # a handful of string objects rather than holding its own copies
+        intern = sys.intern
+        for (event_id, episode_id, _, _, _, _, _, _, _, state, state_fips,
+             event_type, cz_type, cz_fips, cz_name, wfo, injuries_direct,
+             injuries_indirect, deaths_direct, deaths_indirect,
+             damage_property, damage_crops, source, magnitude, magnitude_type,
+             flood_cause, tor_f_scale, tor_length, tor_width, tor_other_wfo,
+             tor_other_cz_state, tor_other_cz_fips, tor_other_cz_name,
+             begin_range, begin_azimuth, begin_location, begin_lat, begin_lon,
+             end_range, end_azimuth, end_location, end_lat, end_lon,
+             episode_narrative, event_narrative), start_time, end_time in zip(
+                 rows, start_times, end_times):
+            has_magnitude = bool(magnitude)
+            is_tornado = bool(tor_f_scale)
+            has_other_cz = is_tornado and bool(tor_other_cz_state)
+            has_begin, has_end = bool(begin_range), bool(end_range)
+            this_cls = cls(
+                event_id=int(event_id),
+                episode_id=int(episode_id),
+                start_time=start_time,
+                end_time=end_time,
+                state=intern(state),
+                state_fips=int(state_fips),
+                event_type=intern(event_type),
+                cz_type=intern(cz_type),
+                cz_fips=int(cz_fips),
+                cz_name=cz_name,
+                wfo=intern(wfo),
+                injuries_direct=int(injuries_direct),
+                injuries_indirect=int(injuries_indirect),
+                deaths_direct=int(deaths_direct),
+                deaths_indirect=int(deaths_indirect),
+                damage_property=damage_property,
+                damage_crops=damage_crops,
+                source=intern(source),
+                magnitude=magnitude if has_magnitude else None,
+                magnitude_type=magnitude_type if has_magnitude else None,
+                flood_cause=flood_cause,
+                tor_f_scale=tor_f_scale if is_tornado else None,
+                tor_length=float(tor_length)
+                if is_tornado and tor_length else None,
+                tor_width=float(tor_width)
+                if is_tornado and tor_width else None,
+                tor_other_wfo=tor_other_wfo if is_tornado else None,
+                tor_other_cz_state=tor_other_cz_state
+                if has_other_cz else None,
+                tor_other_cz_fips=tor_other_cz_fips if has_other_cz else None,
+                tor_other_cz_name=tor_other_cz_name if has_other_cz else None,
+                begin_range=int(begin_range) if has_begin else None,
+                begin_azimuth=intern(begin_azimuth) if has_begin else None,
+                begin_location_name=begin_location if has_begin else None,
+                begin_lat=float(begin_lat) if has_begin else None,
+                begin_lon=float(begin_lon) if has_begin else None,
+                end_range=int(end_range) if has_end else None,
+                end_azimuth=intern(end_azimuth) if has_end else None,
+                end_location_name=end_location if has_end else None,
+                end_lat=float(end_lat) if has_end else None,
+                end_lon=float(end_lon) if has_end else None,
+                episode_narrative=episode_narrative,
+                event_narrative=event_narrative)
+            cls_list.append(this_cls)
 
         return cls_list
 
@@ -144,6 +277,32 @@ class StormEventDetailedReport:
         """
         return self.end_time - self.start_time
 
+    @property
+    def begin_location_str(self) -> Optional[str]:
+        """
+        Description of where the event began (ex. '2 NNE DALLAS')
+
+        Returns:
+            Optional[str]: Range, azimuth and location name, or None if not given
+        """
+        if self.begin_range is None:
+            return None
+        return '%d %s %s' % (self.begin_range, self.begin_azimuth,
+                             self.begin_location_name)
+
+    @property
+    def end_location_str(self) -> Optional[str]:
+        """
+        Description of where the event ended (ex. '2 NNE DALLAS')
+
+        Returns:
+            Optional[str]: Range, azimuth and location name, or None if not given
+        """
+        if self.end_range is None:
+            return None
+        return '%d %s %s' % (self.end_range, self.end_azimuth,
+                             self.end_location_name)
+
     @property
     def is_tornado_event(self) -> bool:
         """
@@ -152,4 +311,4 @@ class StormEventDetailedReport:
         Returns:
             bool: True if this event is related to a tornado
         """
-        return self.tornado is not None
+        return self.tor_f_scale is not None
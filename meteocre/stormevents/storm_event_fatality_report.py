@@ -6,14 +6,22 @@ import csv
 import pathlib
 from typing import Optional, Union, List
 from datetime import datetime
+from operator import itemgetter
 from dataclasses import dataclass
 
 from .utils import to_datetime
 
+# CSV columns read for each fatality report, in order
+_CSV_COLUMNS = ('EVENT_ID', 'FATALITY_ID', 'FAT_YEARMONTH', 'FAT_DAY',
+                'FATALITY_TYPE', 'FATALITY_AGE', 'FATALITY_SEX',
+                'FATALITY_LOCATION')
+
 
 @dataclass
 class StormEventFatalityReport:
     """ Class to store a storm event fatality report the NOAA NCEI Storm Events Database """
+    __slots__ = ('event_id', 'fatality_id', 'fatality_time', 'fatality_type',
+                 'fatality_age', 'fatality_sex', 'fatality_location')
     event_id: int
     fatality_id: int
     fatality_time: datetime
@@ -38,19 +46,25 @@ class StormEventFatalityReport:
         """
         cls_list = []
         with open(csv_file, 'r') as f:
-            dict_reader = csv.DictReader(f)
-            for row in dict_reader:
-                this_cls = cls(event_id=int(row['EVENT_ID']),
-                               fatality_id=int(row['FATALITY_ID']),
-                               fatality_time=to_datetime(
-                                   row['FAT_YEARMONTH'], row['FAT_DAY']),
-                               fatality_type='direct'
-                               if row['FATALITY_TYPE'] == 'D' else 'indirect',
-                               fatality_age=int(row['FATALITY_AGE'])
-                               if len(row['FATALITY_AGE']) else None,
-                               fatality_sex=row['FATALITY_SEX']
-                               if len(row['FATALITY_SEX']) else None,
-                               fatality_location=row['FATALITY_LOCATION'])
+            reader = csv.reader(f)
+
+            # Look up the columns we need once, from the header
+            col_idx = {k: i for i, k in enumerate(next(reader))}
+            get_fields = itemgetter(*(col_idx[k] for k in _CSV_COLUMNS))
+
+            for (event_id, fatality_id, fat_yearmonth, fat_day, fatality_type,
+                 fatality_age, fatality_sex,
+                 fatality_location) in map(get_fields, reader):
+                this_cls = cls(
+                    event_id=int(event_id),
+                    fatality_id=int(fatality_id),
+                    fatality_time=to_datetime(fat_yearmonth, fat_day),
+                    fatality_type='direct'
+                    if fatality_type == 'D' else 'indirect',
+                    fatality_age=int(fatality_age)
+                    if len(fatality_age) else None,
+                    fatality_sex=fatality_sex if len(fatality_sex) else None,
+                    fatality_location=fatality_location)
                 cls_list.append(this_cls)
 
         return cls_list
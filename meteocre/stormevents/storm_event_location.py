@@ -3,14 +3,36 @@
 from __future__ import annotations
 
 import csv
+import sys
 import pathlib
-from typing import Union, List
+from typing import Any, Union, List
+from operator import itemgetter
 from dataclasses import dataclass
 
+from .utils import read_csv_table
+
+# CSV columns read for each location entry, in order
+_CSV_COLUMNS = ('EPISODE_ID', 'EVENT_ID', 'LOCATION_INDEX', 'RANGE', 'AZIMUTH',
+                'LOCATION', 'LATITUDE', 'LONGITUDE')
+
+# PyArrow column types for location entries (see table_from_csv)
+_ARROW_COLUMN_TYPES = {
+    'EPISODE_ID': 'int64',
+    'EVENT_ID': 'int64',
+    'LOCATION_INDEX': 'int32',
+    'RANGE': 'float64',
+    'AZIMUTH': 'string',
+    'LOCATION': 'string',
+    'LATITUDE': 'float64',
+    'LONGITUDE': 'float64',
+}
+
 
 @dataclass
 class StormEventLocation:
     """ Class to store a storm event location entry the NOAA NCEI Storm Events Database """
+    __slots__ = ('episode_id', 'event_id', 'location_idx', 'range', 'azimuth',
+                 'location', 'lat', 'lon')
     episode_id: int
     event_id: int
     location_idx: int
@@ -20,6 +42,20 @@ class StormEventLocation:
     lat: float
     lon: float
 
+    @staticmethod
+    def table_from_csv(csv_file: Union[str, pathlib.Path]) -> Any:
+        """
+        Load location entries from a CSV file as a PyArrow table, without
+        creating an object per entry. Requires the optional pyarrow dependency.
+
+        Args:
+            csv_file (Union[str, pathlib.Path]): CSV file to load in
+
+        Returns:
+            pyarrow.Table: Table of storm event locations from the CSV file
+        """
+        return read_csv_table(csv_file, _ARROW_COLUMN_TYPES)
+
     @classmethod
     def from_csv(
             cls, csv_file: Union[str,
@@ -35,16 +71,24 @@ class StormEventLocation:
         """
         cls_list = []
         with open(csv_file, 'r') as f:
-            dict_reader = csv.DictReader(f)
-            for row in dict_reader:
-                this_cls = cls(episode_id=int(row['EPISODE_ID']),
-                               event_id=int(row['EVENT_ID']),
-                               location_idx=int(row['LOCATION_INDEX']),
-                               range=float(row['RANGE']),
-                               azimuth=row['AZIMUTH'],
-                               location=row['LOCATION'],
-                               lat=float(row['LATITUDE']),
-                               lon=float(row['LONGITUDE']))
+            reader = csv.reader(f)
+
+            # Look up the columns we need once, from the header
+            col_idx = {k: i for i, k in enumerate(next(reader))}
+            get_fields = itemgetter(*(col_idx[k] for k in _CSV_COLUMNS))
+
+            # Azimuths only take a few distinct values, so intern them
+            intern = sys.intern
+            for (episode_id, event_id, location_idx, range_str, azimuth,
+                 location, lat, lon) in map(get_fields, reader):
+                this_cls = cls(episode_id=int(episode_id),
+                               event_id=int(event_id),
+                               location_idx=int(location_idx),
+                               range=float(range_str),
+                               azimuth=intern(azimuth),
+                               location=location,
+                               lat=float(lat),
+                               lon=float(lon))
                 cls_list.append(this_cls)
 
         return cls_list
@@ -1,15 +1,52 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import gzip
+import os
 import shutil
 import pathlib
-from typing import Union, Optional
-from io import BytesIO
+from typing import Any, Dict, List, Union, Optional, Sequence
 from ftplib import FTP
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
-import pytz
+import numpy as np
+
+# ISA-L's gzip is a drop-in, several times faster replacement for the
+# standard library's. Use it if installed.
+try:
+    from isal.igzip import IGzipFile as _GzipFile
+except ImportError:
+    from gzip import GzipFile as _GzipFile
+
+
+@lru_cache(maxsize=256)
+def _parse_yearmonth(yearmonth_str: str) -> tuple[int, int]:
+    """
+    Parse a year/month string from a CSV file (ex. '202205'). Cached, since
+    a year of reports only has a handful of distinct values.
+
+    Args:
+        yearmonth_str (str): Year/month string from CSV file
+
+    Returns:
+        tuple[int, int]: Year, month
+    """
+    return int(yearmonth_str[:4]), int(yearmonth_str[-2:])
+
+
+@lru_cache(maxsize=16)
+def _parse_tz_offset(tz_str: Optional[str]) -> timedelta:
+    """
+    Parse a timezone string from a CSV file (ex. 'CST-6') into its offset
+    from UTC. Cached, since there are only a handful of distinct values.
+
+    Args:
+        tz_str (Optional[str]): Timezone string. If None, assume UTC.
+
+    Returns:
+        timedelta: Hours to subtract to convert to UTC
+    """
+    return timedelta(hours=int(tz_str[-2:]) if tz_str is not None else 0)
 
 
 def to_datetime(yearmonth_str: str,
@@ -28,8 +65,7 @@ def to_datetime(yearmonth_str: str,
     Returns:
         datetime: Timezone-aware datetime object from the CSV fields
     """
-    year = int(yearmonth_str[:4])
-    month = int(yearmonth_str[-2:])
+    year, month = _parse_yearmonth(yearmonth_str)
     day = int(day_str)
     if len(time_str) == 4:
         hour, minute = int(time_str[:2]), int(time_str[-2:])
@@ -38,28 +74,132 @@ def to_datetime(yearmonth_str: str,
     else:
         hour, minute = 0, 0
 
-    if tz_str is not None:
-        tz_offset = int(tz_str[-2:])
-    else:
-        tz_offset = 0
-
     return (datetime(year, month, day, hour, minute) -
-            timedelta(hours=tz_offset)).replace(tzinfo=pytz.UTC)
+            _parse_tz_offset(tz_str)).replace(tzinfo=timezone.utc)
+
+
+def to_datetime_list(yearmonth_strs: Sequence[str], day_strs: Sequence[str],
+                     time_strs: Sequence[str],
+                     tz_strs: Sequence[str]) -> List[datetime]:
+    """
+    Convert whole CSV columns to datetime objects at once. Equivalent to
+    calling to_datetime() on each row, but parses the columns with NumPy.
+
+    Args:
+        yearmonth_strs (Sequence[str]): Year/month strings from CSV file
+        day_strs (Sequence[str]): Day strings from CSV file
+        time_strs (Sequence[str]): Time strings from CSV file
+        tz_strs (Sequence[str]): Timezone strings from CSV file
+
+    Raises:
+        ValueError: If any row is not a valid date / time
+
+    Returns:
+        List[datetime]: Timezone-aware datetime objects from the CSV fields
+    """
+    # Empty columns would be float arrays, which the string ufuncs reject
+    if not len(yearmonth_strs):
+        return []
+
+    yearmonth = np.array(yearmonth_strs).astype(np.int64)
+    day = np.array(day_strs).astype(np.int64)
+
+    # Like to_datetime(), times that aren't 3 or 4 digits are midnight
+    time_arr = np.array(time_strs)
+    time_len = np.char.str_len(time_arr)
+    time_arr = np.where((time_len == 3) | (time_len == 4), time_arr,
+                        '0').astype(np.int64)
+    hour, minute = time_arr // 100, time_arr % 100
+
+    # Only a handful of distinct timezones, so parse each one once
+    tz_uniq, tz_inv = np.unique(np.array(tz_strs), return_inverse=True)
+    tz_offset = np.array([int(e[-2:]) for e in tz_uniq], dtype=np.int64)
+    tz_offset = tz_offset[tz_inv.ravel()]
+
+    # datetime64 arithmetic silently rolls invalid fields over, so check
+    # them like datetime() does
+    month = yearmonth % 100
+    months = ((yearmonth // 100 - 1970) * 12 + month -
+              1).astype('datetime64[M]')
+    month_len = ((months + 1).astype('datetime64[D]') -
+                 months.astype('datetime64[D]')).astype(np.int64)
+    bad = ((month < 1) | (month > 12) | (day < 1) | (day > month_len) |
+           (hour > 23) | (minute > 59))
+    if bad.any():
+        i = int(np.argmax(bad))
+        raise ValueError('Invalid date / time in row %d: %s' %
+                         (i, repr((yearmonth_strs[i], day_strs[i],
+                                   time_strs[i], tz_strs[i]))))
+
+    minutes = ((day - 1) * 1440 + hour * 60 + minute -
+               tz_offset * 60).astype('timedelta64[m]')
+    dt_arr = months.astype('datetime64[m]') + minutes
+
+    utc = timezone.utc
+    return [
+        e.replace(tzinfo=utc)
+        for e in dt_arr.astype('datetime64[us]').tolist()
+    ]
+
+
+def read_csv_table(csv_file: Union[str, pathlib.Path],
+                   column_types: Optional[Dict[str, str]] = None) -> Any:
+    """
+    Read a storm events CSV file into a PyArrow table, using PyArrow's
+    multithreaded CSV parser. Requires the optional pyarrow dependency.
+
+    Args:
+        csv_file (Union[str, pathlib.Path]): CSV file to read in
+        column_types (Optional[Dict[str, str]], optional): Column name -> PyArrow type alias
+            (ex. 'int64') for columns that shouldn't be inferred. Defaults to None.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Returns:
+        pyarrow.Table: Table of the CSV file's columns
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError as e:
+        raise ImportError(
+            'pyarrow is required to load storm events as a table! '
+            'Install with: pip install meteocre[arrow]') from e
+
+    convert_options = pa_csv.ConvertOptions(column_types={
+        k: pa.type_for_alias(v)
+        for k, v in (column_types or {}).items()
+    })
+    return pa_csv.read_csv(str(csv_file), convert_options=convert_options)
 
 
 def ftp_download_and_extract_gzip(
         ftp: FTP, ftp_name: str, output_path: Union[str,
                                                     pathlib.Path]) -> None:
     """
-    Download and extract gzip'd file at an FTP location
+    Simultaneously download and unzip a Gzip archive from an FTP target
 
     Args:
         ftp (FTP): FTP object
         ftp_name (str): Filename to retrieve
         output_path (Union[str, pathlib.Path]): Output path
     """
-    fio = BytesIO()
-    ftp.retrbinary('RETR %s' % ftp_name, fio.write)
-    fio.seek(0)
-    with open(output_path, 'wb') as fout, gzip.GzipFile(fileobj=fio) as gz:
-        shutil.copyfileobj(gz, fout)
+    # Decompress straight from the data connection, rather than buffering
+    # the whole archive in memory first. Write to a temporary file and only
+    # move it into place once the transfer is complete, so a failed
+    # download never leaves a truncated CSV behind.
+    output_path = pathlib.Path(output_path)
+    part_path = output_path.with_suffix(output_path.suffix + '.part')
+    try:
+        ftp.voidcmd('TYPE I')
+        with ftp.transfercmd('RETR %s' % ftp_name) as conn, \
+                conn.makefile('rb') as fin, \
+                _GzipFile(fileobj=fin) as gz, \
+                open(part_path, 'wb') as fout:
+            shutil.copyfileobj(gz, fout, 1 << 20)
+        ftp.voidresp()
+        os.replace(part_path, output_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
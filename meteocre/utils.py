@@ -3,14 +3,23 @@
 """ Common utility functions used by multiple meteocre modules """
 
 import sys
+import shutil
 import pathlib
 import requests
 from typing import Union
 import urllib.parse
+from functools import lru_cache
 
 import numpy as np
-from osgeo import gdal
+from osgeo import gdal, osr
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
+
+# Shared HTTP session, so repeated requests reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
 
 
 def is_url(url: str) -> bool:
@@ -39,7 +48,7 @@ def url_exists(url: str) -> bool:
     Returns:
         bool: True if URL can be downloaded.
     """
-    response = requests.head(url)
+    response = _SESSION.head(url)
     if response.status_code == 200:
         return 'content-length' in response.headers
     else:
@@ -87,17 +96,24 @@ def fetch_from_url(url: str,
         output_path = pathlib.Path(output_path, filename)
 
     # Fetch the file
-    filesize = int(requests.head(url).headers["Content-Length"])
-    with requests.get(url, stream=True) as r, open(
-            output_path, 'wb') as f, tqdm(unit='B',
-                                          unit_scale=True,
-                                          unit_divisor=1024,
-                                          total=filesize,
-                                          file=sys.stdout,
-                                          desc=output_path.name) as progress:
-        for chunk in r.iter_content(chunk_size=1024):
-            size = f.write(chunk)
-            progress.update(size)
+    with _SESSION.get(url, stream=True) as r:
+        # Size comes from the GET response itself, no separate HEAD needed.
+        # Content-Length counts encoded (e.g. gzip) bytes, but progress
+        # counts decoded ones, so it is only a usable total if unencoded.
+        filesize = None
+        if 'Content-Encoding' not in r.headers:
+            filesize = int(r.headers.get('Content-Length', 0)) or None
+        with open(output_path,
+                  'wb') as f, tqdm(unit='B',
+                                   unit_scale=True,
+                                   unit_divisor=1024,
+                                   total=filesize,
+                                   file=sys.stdout,
+                                   desc=output_path.name) as progress:
+            # Copy in 1 MiB blocks, updating progress on each read
+            r.raw.decode_content = True
+            shutil.copyfileobj(
+                CallbackIOWrapper(progress.update, r.raw, 'read'), f, 1 << 20)
 
     return output_path
 
@@ -116,6 +132,45 @@ def gdal_close_dataset(ds: gdal.Dataset) -> None:
     ds = None     # type: ignore
 
 
+def srs_to_proj4(user_input: str) -> str:
+    """
+    Convert a spatial reference to a PROJ.4 string
+
+    Args:
+        user_input (str): Spatial reference. Anything accepted by SetFromUserInput (ex. 'EPSG:4326').
+
+    Returns:
+        str: PROJ.4 string for the spatial reference
+    """
+    srs = osr.SpatialReference()
+    srs.SetFromUserInput(user_input)
+    return srs.ExportToProj4()
+
+
+@lru_cache(maxsize=32)
+def get_coord_transform(src: str, dst: str) -> osr.CoordinateTransformation:
+    """
+    Get a coordinate transformation between two spatial reference systems.
+    Transformations are cached, since PROJ initialization dominates the cost
+    of transforming a handful of points.
+
+    Both systems use traditional GIS axis order, i.e. (x, y) / (lon, lat).
+
+    Args:
+        src (str): Source SRS. Anything accepted by SetFromUserInput,
+            preferably an authority code (ex. 'EPSG:4326') to keep the cache key small.
+        dst (str): Destination SRS. Anything accepted by SetFromUserInput.
+
+    Returns:
+        osr.CoordinateTransformation: Coordinate transformation from src -> dst.
+    """
+    src_srs, dst_srs = osr.SpatialReference(), osr.SpatialReference()
+    for srs, user_input in ((src_srs, src), (dst_srs, dst)):
+        srs.SetFromUserInput(user_input)
+        srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    return osr.CoordinateTransformation(src_srs, dst_srs)
+
+
 def map_to_pix(xform: list[float],
                x_m: Union[float, list[float], np.ndarray],
                y_m: Union[float, list[float], np.ndarray],
@@ -136,18 +191,19 @@ def map_to_pix(xform: list[float],
 
     # Input validation, either both float or both lists
     assert not (isinstance(x_m, float) ^ isinstance(y_m, float))
-    if isinstance(x_m, float):
-        x_m = [x_m]
-    if isinstance(y_m, float):
-        y_m = [y_m]
-    x_m, y_m = np.array(x_m), np.array(y_m)
+    x_m = np.atleast_1d(np.asarray(x_m, dtype=np.float64))
+    y_m = np.atleast_1d(np.asarray(y_m, dtype=np.float64))
     assert x_m.ndim == y_m.ndim == 1
     assert len(x_m) == len(y_m)
 
-    # Do the math!
+    # Do the math! Invert the affine part of the geotransform once, so
+    # each point costs two offsets and a 2x2 matrix multiply
     det = 1 / (xform[1] * xform[5] - xform[2] * xform[4])
-    x_p = det * (xform[5] * (x_m - xform[0]) - xform[2] * (y_m - xform[3]))
-    y_p = det * (xform[1] * (y_m - xform[3]) - xform[4] * (x_m - xform[0]))
+    inv_a, inv_b = det * xform[5], -det * xform[2]
+    inv_c, inv_d = -det * xform[4], det * xform[1]
+    dx, dy = x_m - xform[0], y_m - xform[3]
+    x_p = inv_a * dx + inv_b * dy
+    y_p = inv_c * dx + inv_d * dy
 
     # Round pixel values, if desired
     if round:
@@ -174,11 +230,8 @@ def pix_to_map(
     """
     # Input validation, either both float or both lists
     assert not (isinstance(x_p, float) ^ isinstance(y_p, float))
-    if isinstance(x_p, float):
-        x_p = [x_p]
-    if isinstance(y_p, float):
-        y_p = [y_p]
-    x_p, y_p = np.array(x_p), np.array(y_p)
+    x_p = np.atleast_1d(np.asarray(x_p, dtype=np.float64))
+    y_p = np.atleast_1d(np.asarray(y_p, dtype=np.float64))
     assert x_p.ndim == y_p.ndim == 1
     assert len(x_p) == len(y_p)
 
@@ -225,16 +278,18 @@ def get_px_in_ellipse(center: tuple[int, int], a: float,
         np.ndarray: Set of pixels that fall within the defined ellipse.
     """
 
-    # Start by getting array as if centered at (0, 0)
+    # Start by getting array as if centered at (0, 0). The ellipse test is
+    # separable, so square each axis once and sum them by broadcasting,
+    # rather than building and squaring a dense coordinate grid.
     ax_m = max(a, b)
-    grid = np.mgrid[-ax_m:(ax_m + 1), -ax_m:(ax_m + 1)]
-    grid_sq = np.square(grid)
-    v = (grid_sq[0, :, :] / a**2 + grid_sq[1, :, :] / b**2) <= 1
-    x, y = np.where(v)
-    pts = grid[:, y, x].T
+    offsets = np.arange(-ax_m, ax_m + 1)
+    v = (np.square(offsets)[:, None] / a**2 +
+         np.square(offsets)[None, :] / b**2) <= 1
+    x, y = np.nonzero(v)
+    pts = np.stack((offsets[y], offsets[x]), axis=1)
 
     # Finally, add the center
     pts[:, 0] += center[0]
     pts[:, 1] += center[1]
 
-    return pts
\ No newline at end of file
+    return pts
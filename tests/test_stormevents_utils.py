@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Tests for storm events CSV field parsing """
+
+from datetime import datetime, timezone
+
+import pytest
+
+from meteocre.stormevents.utils import to_datetime, to_datetime_list
+
+
+def test_to_datetime_list_empty():
+    assert to_datetime_list([], [], [], []) == []
+
+
+def test_to_datetime_list_matches_to_datetime():
+    rows = [('202205', '04', '1630', 'CST-6'),
+            ('202205', '31', '905', 'EST-5'), ('202202', '28', '', 'CST-6'),
+            ('202203', '01', '12345', 'MST-7')]
+    expected = [to_datetime(*row) for row in rows]
+    assert to_datetime_list(*zip(*rows)) == expected
+    assert expected[0] == datetime(2022, 5, 4, 22, 30, tzinfo=timezone.utc)
+
+
+def test_to_datetime_list_invalid_day():
+    with pytest.raises(ValueError):
+        to_datetime_list(['202204'], ['31'], ['1200'], ['CST-6'])